@@ -0,0 +1,66 @@
+package main
+
+import (
+	"io"
+	"sync"
+)
+
+// asyncWriter moves log output off the calling goroutine. Writes are copied
+// onto a buffered channel and a single background goroutine performs the
+// actual write, so request handlers never stall on a slow stdout/journald
+// pipe. Writes only block if the buffer is full, so no lines are dropped.
+type asyncWriter struct {
+	out    io.Writer
+	lines  chan []byte
+	done   chan struct{}
+	mu     sync.Mutex
+	closed bool
+}
+
+// newAsyncWriter starts a background writer with room for size pending lines
+func newAsyncWriter(out io.Writer, size int) *asyncWriter {
+	w := &asyncWriter{
+		out:   out,
+		lines: make(chan []byte, size),
+		done:  make(chan struct{}),
+	}
+
+	go func() {
+		defer close(w.done)
+		for line := range w.lines {
+			w.out.Write(line)
+		}
+	}()
+
+	return w
+}
+
+// Write queues a copy of p (slog handlers reuse their buffers)
+func (w *asyncWriter) Write(p []byte) (int, error) {
+	w.mu.Lock()
+	defer w.mu.Unlock()
+
+	if w.closed {
+		return w.out.Write(p)
+	}
+
+	line := make([]byte, len(p))
+	copy(line, p)
+	w.lines <- line
+	return len(p), nil
+}
+
+// Close flushes pending lines; later writes go straight to the output
+func (w *asyncWriter) Close() error {
+	w.mu.Lock()
+	if w.closed {
+		w.mu.Unlock()
+		return nil
+	}
+	w.closed = true
+	close(w.lines)
+	w.mu.Unlock()
+
+	<-w.done
+	return nil
+}
@@ -0,0 +1,82 @@
+package main
+
+import (
+	"bytes"
+	"fmt"
+	"sync"
+	"testing"
+	"time"
+)
+
+// slowBuffer is a goroutine-safe buffer that stalls on every write, so lines
+// are still queued when Close is called
+type slowBuffer struct {
+	mu  sync.Mutex
+	buf bytes.Buffer
+}
+
+func (b *slowBuffer) Write(p []byte) (int, error) {
+	time.Sleep(time.Millisecond)
+	b.mu.Lock()
+	defer b.mu.Unlock()
+	return b.buf.Write(p)
+}
+
+func (b *slowBuffer) String() string {
+	b.mu.Lock()
+	defer b.mu.Unlock()
+	return b.buf.String()
+}
+
+func TestAsyncWriter(t *testing.T) {
+	tests := []struct {
+		name       string
+		size       int
+		lines      int
+		afterClose string
+	}{
+		{name: "flushes queued lines on close", size: 64, lines: 50},
+		{name: "blocks instead of dropping when full", size: 1, lines: 20},
+		{name: "writes through after close", size: 4, lines: 3, afterClose: "late\n"},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			out := &slowBuffer{}
+			w := newAsyncWriter(out, tt.size)
+
+			var want bytes.Buffer
+			line := make([]byte, 0, 16)
+			for i := 0; i < tt.lines; i++ {
+				// Reuse one buffer like slog handlers do; Write must copy it
+				line = fmt.Appendf(line[:0], "line %d\n", i)
+				if _, err := w.Write(line); err != nil {
+					t.Fatalf("Write: %v", err)
+				}
+				want.Write(line)
+			}
+
+			if err := w.Close(); err != nil {
+				t.Fatalf("Close: %v", err)
+			}
+			if got := out.String(); got != want.String() {
+				t.Fatalf("output after Close = %q, want %q", got, want.String())
+			}
+
+			if tt.afterClose != "" {
+				if _, err := w.Write([]byte(tt.afterClose)); err != nil {
+					t.Fatalf("Write after Close: %v", err)
+				}
+				want.WriteString(tt.afterClose)
+				if got := out.String(); got != want.String() {
+					t.Fatalf("output after late write = %q, want %q", got, want.String())
+				}
+			}
+
+			// A second Close is a no-op
+			if err := w.Close(); err != nil {
+				t.Fatalf("second Close: %v", err)
+			}
+		})
+	}
+}
@@ -57,25 +57,38 @@ func main() {
 }
 
 func run(cmd *cobra.Command, args []string) {
-	// Setup structured logging
-	logger := slog.New(slog.NewJSONHandler(os.Stdout, &slog.HandlerOptions{
+	// Setup structured logging (written from a background goroutine)
+	logOut := newAsyncWriter(os.Stdout, 1024)
+	defer logOut.Close()
+
+	logger := slog.New(slog.NewJSONHandler(logOut, &slog.HandlerOptions{
 		Level: slog.LevelInfo,
 	}))
 	slog.SetDefault(logger)
 
+	// fatalf is log.Fatalf that flushes queued log lines before exiting
+	fatalf := func(format string, v ...any) {
+		log.Printf(format, v...)
+		logOut.Close()
+		os.Exit(1)
+	}
+
 	logger.Info("zeropoint-agent starting")
 
 	dockerClient, err := client.NewClientWithOpts(client.FromEnv, client.WithAPIVersionNegotiation())
 	if err != nil {
-		log.Fatalf("failed to create docker client: %v", err)
+		fatalf("failed to create docker client: %v", err)
 	}
 	defer dockerClient.Close()
 
-	// Start Envoy proxy
+	// Start Envoy proxy in the background: creating (or pulling) the container
+	// is the slowest startup step and is independent of xDS and mDNS setup.
+	// Envoy retries its xDS connection, so it may come up in either order.
 	envoyMgr := envoy.NewManager(dockerClient, logger)
-	if err := envoyMgr.EnsureRunning(context.Background()); err != nil {
-		log.Fatalf("failed to start envoy: %v", err)
-	}
+	envoyErr := make(chan error, 1)
+	go func() {
+		envoyErr <- envoyMgr.EnsureRunning(context.Background())
+	}()
 
 	// Start xDS control plane
 	logger.Info("initializing xDS server")
@@ -85,23 +98,13 @@ func run(cmd *cobra.Command, args []string) {
 
 	logger.Info("starting xDS server on port 18000")
 	if err := xdsServer.Start(ctx, 18000); err != nil {
-		log.Fatalf("failed to start xDS server: %v", err)
+		fatalf("failed to start xDS server: %v", err)
 	}
 	logger.Info("xDS server started successfully")
 
-	// Give xDS server time to start
-	time.Sleep(500 * time.Millisecond)
-
-	// Create initial empty snapshot
-	snapshot, err := xds.BuildSnapshot(xdsServer.NextVersion())
-	if err != nil {
-		log.Fatalf("failed to build initial snapshot: %v", err)
-	}
-
-	logger.Info("setting initial snapshot", "version", snapshot.GetVersion("listeners"))
-	if err := xdsServer.UpdateSnapshot(context.Background(), snapshot); err != nil {
-		log.Fatalf("failed to set initial snapshot: %v", err)
-	}
+	// No placeholder snapshot is pushed here: the router builds the first one
+	// from the persisted exposures, so Envoy goes straight to the real config
+	// instead of briefly serving an empty route table after a restart.
 
 	// Get port from environment variable, default to 2370
 	portStr := os.Getenv("ZEROPOINT_AGENT_PORT")
@@ -111,7 +114,7 @@ func run(cmd *cobra.Command, args []string) {
 
 	portNum, err := strconv.Atoi(portStr)
 	if err != nil {
-		log.Fatalf("invalid port number: %v", err)
+		fatalf("invalid port number: %v", err)
 	}
 
 	// Register mDNS service (before router so it's available for exposures)
@@ -121,6 +124,11 @@ func run(cmd *cobra.Command, args []string) {
 	}
 	defer mdnsService.Shutdown()
 
+	// The router reconciles exposures onto Envoy, so it must be running by now
+	if err := <-envoyErr; err != nil {
+		fatalf("failed to start envoy: %v", err)
+	}
+
 	// Initialize boot monitor
 	bootMonitor := boot.NewBootMonitor(logger)
 
@@ -133,19 +141,25 @@ func run(cmd *cobra.Command, args []string) {
 
 	router, err := api.NewRouter(dockerClient, xdsServer, mdnsService, bootMonitor, logger)
 	if err != nil {
-		log.Fatalf("failed to create router: %v", err)
+		fatalf("failed to create router: %v", err)
 	}
 
+	// net/http already serves each connection on its own goroutine across all
+	// cores; bound header reads and idle keep-alives so slow or abandoned
+	// clients (e.g. closed UI tabs) don't pin connections. No WriteTimeout:
+	// install/uninstall responses stream progress for as long as they run.
 	srv := &http.Server{
-		Addr:    ":" + portStr,
-		Handler: router,
+		Addr:              ":" + portStr,
+		Handler:           router,
+		ReadHeaderTimeout: 10 * time.Second,
+		IdleTimeout:       120 * time.Second,
 	}
 
 	// Start server
 	go func() {
 		logger.Info("starting server", "addr", srv.Addr)
 		if err := srv.ListenAndServe(); err != nil && err != http.ErrServerClosed {
-			log.Fatalf("http server error: %v", err)
+			fatalf("http server error: %v", err)
 		}
 	}()
 
@@ -158,7 +172,7 @@ func run(cmd *cobra.Command, args []string) {
 	shutdownCtx, shutdownCancel := context.WithTimeout(context.Background(), 10*time.Second)
 	defer shutdownCancel()
 	if err := srv.Shutdown(shutdownCtx); err != nil {
-		log.Fatalf("server shutdown failed: %v", err)
+		fatalf("server shutdown failed: %v", err)
 	}
 	logger.Info("server stopped")
 }
@@ -37,9 +37,7 @@ func NewBootHandlers(monitor *boot.BootMonitor) *BootHandlers {
 func (h *BootHandlers) HandleBootStatus(w http.ResponseWriter, r *http.Request) {
 	// Return ordered slice: [{service, markers}, ...]
 	markers := h.monitor.GetServiceStatuses()
-	w.Header().Set("Content-Type", "application/json")
-	w.WriteHeader(http.StatusOK)
-	json.NewEncoder(w).Encode(markers)
+	writeJSONConditional(w, r, markers)
 }
 
 // HandleBootService serves GET /api/boot/status/{service}
@@ -61,19 +59,14 @@ func (h *BootHandlers) HandleBootService(w http.ResponseWriter, r *http.Request)
 	if service == "" {
 		// Fallback: parse path directly
 		// path: /api/boot/status/{service}
-		parts := strings.Split(strings.TrimPrefix(r.URL.Path, "/api/boot/status/"), "/")
-		if len(parts) > 0 {
-			service = parts[0]
-		}
+		service, _, _ = strings.Cut(strings.TrimPrefix(r.URL.Path, "/api/boot/status/"), "/")
 	}
 
 	markers, ok := h.monitor.GetServiceStatus(service)
 	if !ok {
 		markers = []boot.MarkerEntry{}
 	}
-	w.Header().Set("Content-Type", "application/json")
-	w.WriteHeader(http.StatusOK)
-	json.NewEncoder(w).Encode(markers)
+	writeJSON(w, http.StatusOK, markers)
 }
 
 // HandleBootMarker serves GET /api/boot/status/{service}/{marker}
@@ -96,13 +89,9 @@ func (h *BootHandlers) HandleBootMarker(w http.ResponseWriter, r *http.Request)
 	}
 	if service == "" || marker == "" {
 		// Fallback: parse path
-		parts := strings.Split(strings.TrimPrefix(r.URL.Path, "/api/boot/status/"), "/")
-		if len(parts) > 0 {
-			service = parts[0]
-		}
-		if len(parts) > 1 {
-			marker = parts[1]
-		}
+		rest := strings.TrimPrefix(r.URL.Path, "/api/boot/status/")
+		service, rest, _ = strings.Cut(rest, "/")
+		marker, _, _ = strings.Cut(rest, "/")
 	}
 
 	if service == "" || marker == "" {
@@ -112,13 +101,21 @@ func (h *BootHandlers) HandleBootMarker(w http.ResponseWriter, r *http.Request)
 	}
 
 	me, ok := h.monitor.GetMarker(service, marker)
-	w.Header().Set("Content-Type", "application/json")
-	w.WriteHeader(http.StatusOK)
 	if !ok {
-		json.NewEncoder(w).Encode(map[string]interface{}{})
+		writeJSON(w, http.StatusOK, map[string]interface{}{})
 		return
 	}
-	json.NewEncoder(w).Encode(me)
+	writeJSON(w, http.StatusOK, me)
+}
+
+// BootLogsResponse is the response for GET /api/boot/logs.
+// Fields are in the order the previous map encoding produced.
+type BootLogsResponse struct {
+	Level   string          `json:"level"`
+	Limit   int             `json:"limit"`
+	Logs    []boot.LogEntry `json:"logs"`
+	Offset  int             `json:"offset"`
+	Service string          `json:"service"`
 }
 
 // HandleBootLogs serves GET /api/boot/logs
@@ -138,7 +135,7 @@ func (h *BootHandlers) HandleBootMarker(w http.ResponseWriter, r *http.Request)
 // @Param level query string false "Filter by level (info, warn, error)"
 // @Param limit query int false "Maximum entries to return (default 100, max 1000)"
 // @Param offset query int false "Offset into log list (default 0)"
-// @Success 200 {object} map[string]interface{} "Boot logs response with service, level, offset, limit, and logs array"
+// @Success 200 {object} BootLogsResponse "Boot logs response with service, level, offset, limit, and logs array"
 // @Router /api/boot/logs [get]
 func (h *BootHandlers) HandleBootLogs(w http.ResponseWriter, r *http.Request) {
 	service := r.URL.Query().Get("service")
@@ -183,17 +180,15 @@ func (h *BootHandlers) HandleBootLogs(w http.ResponseWriter, r *http.Request) {
 		logs = []boot.LogEntry{}
 	}
 
-	response := map[string]interface{}{
-		"service": service,
-		"level":   level,
-		"offset":  offset,
-		"limit":   limit,
-		"logs":    logs,
+	response := BootLogsResponse{
+		Service: service,
+		Level:   level,
+		Offset:  offset,
+		Limit:   limit,
+		Logs:    logs,
 	}
 
-	w.Header().Set("Content-Type", "application/json")
-	w.WriteHeader(http.StatusOK)
-	json.NewEncoder(w).Encode(response)
+	writeJSON(w, http.StatusOK, response)
 }
 
 // HandleBootStream serves WS /api/boot/stream
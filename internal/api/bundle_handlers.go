@@ -2,7 +2,6 @@ package api
 
 import (
 	"context"
-	"encoding/json"
 	"fmt"
 	"log/slog"
 	"net/http"
@@ -116,8 +115,7 @@ func (h *BundleHandlers) ListBundles(w http.ResponseWriter, r *http.Request) {
 		bundles = append(bundles, bundle)
 	}
 
-	w.Header().Set("Content-Type", "application/json")
-	json.NewEncoder(w).Encode(bundles)
+	writeJSONConditional(w, r, bundles)
 }
 
 // GetBundle handles GET /api/bundles/{bundle-id} - gets a specific installed bundle
@@ -168,8 +166,7 @@ func (h *BundleHandlers) GetBundle(w http.ResponseWriter, r *http.Request) {
 		bundle.Exposures[comp.ID] = BundleExposure{}
 	}
 
-	w.Header().Set("Content-Type", "application/json")
-	json.NewEncoder(w).Encode(bundle)
+	writeJSON(w, http.StatusOK, bundle)
 }
 
 // DeleteBundle handles DELETE /api/bundles/{bundle-id} - uninstalls all bundle components immediately with streaming updates
@@ -1,6 +1,7 @@
 package api
 
 import (
+	"bytes"
 	"encoding/json"
 	"fmt"
 	"log/slog"
@@ -44,6 +45,7 @@ type BundleStore struct {
 	bundles     map[string]*BundleRecord // keyed by bundle ID
 	mutex       sync.RWMutex
 	storagePath string
+	saved       []byte // contents of the file as last loaded or saved
 	logger      *slog.Logger
 }
 
@@ -74,6 +76,13 @@ func NewBundleStore(logger *slog.Logger) (*BundleStore, error) {
 
 // CreateBundle creates a new bundle record (called at start of installation)
 func (s *BundleStore) CreateBundle(bundleID, bundleName, jobID string) interface{} {
+	return s.CreateBundleWithComponents(bundleID, bundleName, jobID, nil, nil, nil)
+}
+
+// CreateBundleWithComponents creates a new bundle record with all of its
+// components already listed as "queued". The record is written to disk once,
+// rather than once per component as with the Add*Component methods.
+func (s *BundleStore) CreateBundleWithComponents(bundleID, bundleName, jobID string, moduleIDs, linkIDs, exposureIDs []string) interface{} {
 	s.mutex.Lock()
 	defer s.mutex.Unlock()
 
@@ -83,9 +92,9 @@ func (s *BundleStore) CreateBundle(bundleID, bundleName, jobID string) interface
 		Status:      "running",
 		InstalledAt: time.Now(),
 		Components: BundleComponents{
-			Modules:   make([]BundleComponentStatus, 0),
-			Links:     make([]BundleComponentStatus, 0),
-			Exposures: make([]BundleComponentStatus, 0),
+			Modules:   queuedComponents(moduleIDs),
+			Links:     queuedComponents(linkIDs),
+			Exposures: queuedComponents(exposureIDs),
 		},
 		JobID: jobID,
 	}
@@ -96,6 +105,15 @@ func (s *BundleStore) CreateBundle(bundleID, bundleName, jobID string) interface
 	return bundle
 }
 
+// queuedComponents builds component statuses for the given IDs, all "queued"
+func queuedComponents(ids []string) []BundleComponentStatus {
+	components := make([]BundleComponentStatus, 0, len(ids))
+	for _, id := range ids {
+		components = append(components, BundleComponentStatus{ID: id, Status: "queued"})
+	}
+	return components
+}
+
 // AddModuleComponent adds a module to the bundle's components
 func (s *BundleStore) AddModuleComponent(bundleID, moduleID string, status, errMsg string) error {
 	s.mutex.Lock()
@@ -315,12 +333,16 @@ func (s *BundleStore) DeleteBundle(bundleID string) error {
 	return s.save()
 }
 
-// save writes bundles to disk
+// save writes bundles to disk. Component status updates often leave the
+// record unchanged, so the write is skipped when the contents are identical.
 func (s *BundleStore) save() error {
 	data, err := json.MarshalIndent(s.bundles, "", "  ")
 	if err != nil {
 		return err
 	}
+	if bytes.Equal(data, s.saved) {
+		return nil
+	}
 
 	// Atomic write: write to temp file, then rename
 	tmpPath := s.storagePath + ".tmp"
@@ -328,7 +350,12 @@ func (s *BundleStore) save() error {
 		return err
 	}
 
-	return os.Rename(tmpPath, s.storagePath)
+	if err := os.Rename(tmpPath, s.storagePath); err != nil {
+		return err
+	}
+
+	s.saved = data
+	return nil
 }
 
 // load reads bundles from disk
@@ -341,5 +368,10 @@ func (s *BundleStore) load() error {
 		return err
 	}
 
-	return json.Unmarshal(data, &s.bundles)
+	if err := json.Unmarshal(data, &s.bundles); err != nil {
+		return err
+	}
+
+	s.saved = data
+	return nil
 }
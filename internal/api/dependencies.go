@@ -94,8 +94,28 @@ func (g *DependencyGraph) TopologicalSort() ([]string, error) {
 	return result, nil
 }
 
+// LinkReferences indexes the module references in a link request by module
+// and input name, so the request's values are only parsed once
+type LinkReferences map[string]map[string]AppReference
+
+// ParseLinkReferences extracts every module reference from app configurations
+func ParseLinkReferences(apps map[string]map[string]interface{}) LinkReferences {
+	refs := make(LinkReferences, len(apps))
+	for moduleName, config := range apps {
+		for inputName, value := range config {
+			if ref, isRef := parseAppReference(value); isRef {
+				if refs[moduleName] == nil {
+					refs[moduleName] = make(map[string]AppReference)
+				}
+				refs[moduleName][inputName] = ref
+			}
+		}
+	}
+	return refs
+}
+
 // AnalyzeDependencies builds a dependency graph from app configurations
-func AnalyzeDependencies(apps map[string]map[string]interface{}) (*DependencyGraph, error) {
+func AnalyzeDependencies(apps map[string]map[string]interface{}, refs LinkReferences) (*DependencyGraph, error) {
 	graph := NewDependencyGraph()
 
 	// Add all apps as nodes
@@ -104,13 +124,10 @@ func AnalyzeDependencies(apps map[string]map[string]interface{}) (*DependencyGra
 	}
 
 	// Analyze dependencies
-	for moduleName, config := range apps {
-		for _, value := range config {
-			// Check if value is a module reference
-			if ref, isRef := parseAppReference(value); isRef {
-				// This module depends on the referenced module
-				graph.AddDependency(moduleName, ref.FromModule)
-			}
+	for moduleName, moduleRefs := range refs {
+		for _, ref := range moduleRefs {
+			// This module depends on the referenced module
+			graph.AddDependency(moduleName, ref.FromModule)
 		}
 	}
 
@@ -145,11 +162,10 @@ func parseAppReference(value interface{}) (AppReference, bool) {
 			content := str[2 : len(str)-1]
 
 			// Split on first dot to get module and output
-			parts := strings.SplitN(content, ".", 2)
-			if len(parts) == 2 {
+			if fromModule, output, found := strings.Cut(content, "."); found {
 				return AppReference{
-					FromModule: parts[0],
-					Output:     parts[1],
+					FromModule: fromModule,
+					Output:     output,
 				}, true
 			}
 		}
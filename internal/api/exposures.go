@@ -14,6 +14,7 @@ import (
 
 	internalPaths "zeropoint-agent/internal"
 	"zeropoint-agent/internal/mdns"
+	"zeropoint-agent/internal/modules"
 	"zeropoint-agent/internal/network"
 	"zeropoint-agent/internal/xds"
 
@@ -149,13 +150,18 @@ func (s *ExposureStore) CreateExposure(ctx context.Context, exposureID, moduleID
 		exposure.HostPort = hostPort
 	}
 
-	// Ensure container is on zeropoint-network
-	if err := s.ensureNetwork(ctx, moduleID); err != nil {
+	// Ensure container is on zeropoint-network. The network is resolved once
+	// and reused for the Envoy connection below.
+	networkID, err := s.networkManager.EnsureNetworkExists(ctx, "zeropoint-network")
+	if err != nil {
+		return nil, false, err
+	}
+	if err := s.networkManager.ConnectContainer(ctx, networkID, moduleID+"-main"); err != nil {
 		return nil, false, err
 	}
 
 	// Ensure Envoy is also connected to zeropoint-network (critical for xDS to work)
-	if err := s.ensureEnvoyNetwork(ctx); err != nil {
+	if err := s.networkManager.ConnectContainer(ctx, networkID, "zeropoint-envoy"); err != nil {
 		s.logger.Warn("Failed to connect Envoy to zeropoint-network", "error", err)
 		// Don't fail the exposure creation, but log the issue
 	}
@@ -352,48 +358,18 @@ func (s *ExposureStore) getContainerStatus(moduleID string) string {
 	return "unavailable"
 }
 
+// exposureStatus derives an exposure's status from a prebuilt container index
+func exposureStatus(index modules.ContainerIndex, moduleID string) string {
+	if index.State(moduleID+"-main") == "running" {
+		return "available"
+	}
+	return "unavailable"
+}
+
 // ensureNetwork connects container to zeropoint-network
 func (s *ExposureStore) ensureNetwork(ctx context.Context, appID string) error {
-	networkName := "zeropoint-network"
 	// Container name is app ID + "-main"
-	containerName := appID + "-main"
-
-	// Create network if it doesn't exist
-	networkList, err := s.dockerClient.NetworkList(ctx, client.NetworkListOptions{})
-	if err != nil {
-		return fmt.Errorf("failed to list networks: %w", err)
-	}
-
-	networkExists := false
-	var networkID string
-	for _, network := range networkList.Items {
-		if network.Name == networkName {
-			networkExists = true
-			networkID = network.ID
-			break
-		}
-	}
-
-	if !networkExists {
-		resp, err := s.dockerClient.NetworkCreate(ctx, networkName, client.NetworkCreateOptions{
-			Driver: "bridge",
-		})
-		if err != nil {
-			return fmt.Errorf("failed to create network: %w", err)
-		}
-		networkID = resp.ID
-		s.logger.Info("created zeropoint-network", "id", networkID)
-	}
-
-	// Connect container to network (idempotent)
-	_, err = s.dockerClient.NetworkConnect(ctx, networkID, client.NetworkConnectOptions{
-		Container: containerName,
-	})
-	if err != nil && !isAlreadyConnectedError(err) {
-		return fmt.Errorf("failed to connect container to network: %w", err)
-	}
-
-	return nil
+	return s.networkManager.ConnectContainerToNetwork(ctx, appID+"-main", "zeropoint-network")
 }
 
 // EnsureNetwork connects a container to zeropoint-network (public wrapper)
@@ -404,50 +380,28 @@ func (s *ExposureStore) EnsureNetwork(ctx context.Context, moduleID string) erro
 // EnsureAppOnNetwork connects a container to a specified network (for shared networks)
 func (s *ExposureStore) EnsureModuleOnNetwork(ctx context.Context, moduleID, networkName string) error {
 	containerName := moduleID + "-main"
-
-	// Create network if it doesn't exist
-	networkList, err := s.dockerClient.NetworkList(ctx, client.NetworkListOptions{})
-	if err != nil {
-		return fmt.Errorf("failed to list networks: %w", err)
-	}
-
-	networkExists := false
-	var networkID string
-	for _, network := range networkList.Items {
-		if network.Name == networkName {
-			networkExists = true
-			networkID = network.ID
-			break
-		}
-	}
-
-	if !networkExists {
-		resp, err := s.dockerClient.NetworkCreate(ctx, networkName, client.NetworkCreateOptions{
-			Driver: "bridge",
-		})
-		if err != nil {
-			return fmt.Errorf("failed to create network %s: %w", networkName, err)
-		}
-		networkID = resp.ID
-		s.logger.Info("created shared network", "network", networkName, "id", networkID)
-	}
-
-	// Connect container to network (idempotent)
-	_, err = s.dockerClient.NetworkConnect(ctx, networkID, client.NetworkConnectOptions{
-		Container: containerName,
-	})
-	if err != nil && !isAlreadyConnectedError(err) {
-		return fmt.Errorf("failed to connect container %s to network %s: %w", containerName, networkName, err)
+	if err := s.networkManager.ConnectContainerToNetwork(ctx, containerName, networkName); err != nil {
+		return err
 	}
 
 	s.logger.Info("connected container to shared network", "container", containerName, "network", networkName)
 	return nil
 }
 
-// reconcileNetworks ensures all containers are connected to zeropoint-network
+// reconcileNetworks ensures all containers are connected to zeropoint-network.
+// The network is resolved once up front rather than listed per exposure.
 func (s *ExposureStore) reconcileNetworks(ctx context.Context) error {
+	if len(s.exposures) == 0 {
+		return nil
+	}
+
+	networkID, err := s.networkManager.EnsureNetworkExists(ctx, "zeropoint-network")
+	if err != nil {
+		return err
+	}
+
 	for _, exp := range s.exposures {
-		if err := s.ensureNetwork(ctx, exp.ModuleID); err != nil {
+		if err := s.networkManager.ConnectContainer(ctx, networkID, exp.ModuleID+"-main"); err != nil {
 			s.logger.Warn("failed to reconnect container to network", "module_id", exp.ModuleID, "error", err)
 		}
 	}
@@ -528,32 +482,3 @@ func (s *ExposureStore) getExposureInfos() []mdns.ExposureInfo {
 	}
 	return infos
 }
-
-// ensureEnvoyNetwork connects Envoy container to zeropoint-network
-func (s *ExposureStore) ensureEnvoyNetwork(ctx context.Context) error {
-	return s.networkManager.ConnectContainerToNetwork(ctx, "zeropoint-envoy", "zeropoint-network")
-}
-
-// isAlreadyConnectedError checks if error is "already connected"
-func isAlreadyConnectedError(err error) bool {
-	if err == nil {
-		return false
-	}
-	errStr := err.Error()
-	return containsString(errStr, "already connected") ||
-		containsString(errStr, "already exists in network") ||
-		containsString(errStr, "already attached")
-}
-
-func containsString(s, substr string) bool {
-	return len(s) >= len(substr) && (s == substr || len(s) > len(substr) && (s[:len(substr)] == substr || s[len(s)-len(substr):] == substr || findInString(s, substr)))
-}
-
-func findInString(s, substr string) bool {
-	for i := 0; i <= len(s)-len(substr); i++ {
-		if s[i:i+len(substr)] == substr {
-			return true
-		}
-	}
-	return false
-}
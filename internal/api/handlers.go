@@ -10,6 +10,7 @@ import (
 	"path/filepath"
 	"runtime"
 	"strconv"
+	"sync"
 
 	internalPaths "zeropoint-agent/internal"
 	"zeropoint-agent/internal/modules"
@@ -120,7 +121,7 @@ func (h *ExposureHandlers) CreateExposureHTTP(w http.ResponseWriter, r *http.Req
 		return
 	}
 
-	resp := toExposureResponse(exposure, h.store)
+	resp := toExposureResponse(exposure, h.store.getContainerStatus(exposure.ModuleID))
 
 	w.Header().Set("Content-Type", "application/json")
 	if created {
@@ -145,12 +146,18 @@ func (h *ExposureHandlers) ListExposures(w http.ResponseWriter, r *http.Request)
 		Exposures: make([]ExposureResponse, len(exposures)),
 	}
 
+	// Resolve every exposure's status from one container listing instead of
+	// inspecting each container in turn
+	containerIndex, err := modules.ListContainers(r.Context(), h.store.dockerClient)
+	if err != nil {
+		h.logger.Warn("failed to list containers", "error", err)
+	}
+
 	for i, exp := range exposures {
-		resp.Exposures[i] = toExposureResponse(exp, h.store)
+		resp.Exposures[i] = toExposureResponse(exp, exposureStatus(containerIndex, exp.ModuleID))
 	}
 
-	w.Header().Set("Content-Type", "application/json")
-	json.NewEncoder(w).Encode(resp)
+	writeJSONConditional(w, r, resp)
 }
 
 // GetExposure handles GET /exposures/{exposure_id}
@@ -172,10 +179,9 @@ func (h *ExposureHandlers) GetExposure(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
-	resp := toExposureResponse(exposure, h.store)
+	resp := toExposureResponse(exposure, h.store.getContainerStatus(exposure.ModuleID))
 
-	w.Header().Set("Content-Type", "application/json")
-	json.NewEncoder(w).Encode(resp)
+	writeJSON(w, http.StatusOK, resp)
 }
 
 // CreateExposure creates an exposure (for job queue)
@@ -212,13 +218,13 @@ func (h *ExposureHandlers) DeleteExposureHTTP(w http.ResponseWriter, r *http.Req
 }
 
 // toExposureResponse converts an Exposure to ExposureResponse
-func toExposureResponse(exp *Exposure, store *ExposureStore) ExposureResponse {
+func toExposureResponse(exp *Exposure, status string) ExposureResponse {
 	resp := ExposureResponse{
 		ID:            exp.ID,
 		ModuleID:      exp.ModuleID,
 		Protocol:      exp.Protocol,
 		ContainerPort: exp.ContainerPort,
-		Status:        store.getContainerStatus(exp.ModuleID),
+		Status:        status,
 		CreatedAt:     exp.CreatedAt.Format("2006-01-02T15:04:05Z07:00"),
 		Tags:          exp.Tags,
 	}
@@ -293,14 +299,6 @@ type ModulesResponse struct {
 	Modules []Module `json:"modules"`
 }
 
-// RegisterRoutes registers the link-related routes
-func (h *LinkHandlers) RegisterRoutes(router *mux.Router) {
-	router.HandleFunc("/links", h.ListLinks).Methods("GET")
-	router.HandleFunc("/links/{id}", h.GetLink).Methods("GET")
-	router.HandleFunc("/links/{id}", h.CreateOrUpdateLink).Methods("POST")
-	router.HandleFunc("/links/{id}", h.DeleteLinkHTTP).Methods("DELETE")
-}
-
 // ListLinks handles GET /links
 // @ID listLinks
 // @Summary List all links
@@ -314,8 +312,7 @@ func (h *LinkHandlers) ListLinks(w http.ResponseWriter, r *http.Request) {
 
 	response := LinksResponse{Links: links}
 
-	w.Header().Set("Content-Type", "application/json")
-	json.NewEncoder(w).Encode(response)
+	writeJSONConditional(w, r, response)
 }
 
 // GetLink handles GET /links/{id}
@@ -338,8 +335,7 @@ func (h *LinkHandlers) GetLink(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
-	w.Header().Set("Content-Type", "application/json")
-	json.NewEncoder(w).Encode(link)
+	writeJSON(w, http.StatusOK, link)
 }
 
 // CreateOrUpdateLink handles POST /links/{id}
@@ -424,8 +420,11 @@ func (h *LinkHandlers) DeleteLinkHTTP(w http.ResponseWriter, r *http.Request) {
 // linkApps contains the core linking logic (refactored from LinkApps)
 func (h *LinkHandlers) linkApps(linkID string, modules map[string]map[string]interface{}, tags []string) LinkResponse {
 
+	// Parse module references once for all steps below
+	refs := ParseLinkReferences(modules)
+
 	// Step 1: Validate all modules exist
-	if err := h.validateAppsExist(modules); err != nil {
+	if err := h.validateAppsExist(modules, refs); err != nil {
 		h.logger.Error("Module validation failed", "error", err)
 		return LinkResponse{
 			Success: false,
@@ -434,7 +433,7 @@ func (h *LinkHandlers) linkApps(linkID string, modules map[string]map[string]int
 	}
 
 	// Step 2: Analyze dependencies and determine order
-	graph, err := AnalyzeDependencies(modules)
+	graph, err := AnalyzeDependencies(modules, refs)
 	if err != nil {
 		h.logger.Error("Dependency analysis failed", "error", err)
 		return LinkResponse{
@@ -468,6 +467,7 @@ func (h *LinkHandlers) linkApps(linkID string, modules map[string]map[string]int
 	// Step 4: Apply configurations in dependency order
 	errors := make(map[string]string)
 	appliedModules := []string{}
+	outputs := make(moduleOutputCache)
 
 	for _, moduleName := range order {
 		config, exists := modules[moduleName]
@@ -477,7 +477,7 @@ func (h *LinkHandlers) linkApps(linkID string, modules map[string]map[string]int
 
 		h.logger.Info("Applying configuration", "module", moduleName, "config", config)
 
-		if err := h.applyModuleConfiguration(moduleName, config); err != nil {
+		if err := h.applyModuleConfiguration(moduleName, config, refs[moduleName], outputs); err != nil {
 			errors[moduleName] = err.Error()
 			h.logger.Error("Failed to apply configuration", "module", moduleName, "error", err)
 
@@ -499,7 +499,7 @@ func (h *LinkHandlers) linkApps(linkID string, modules map[string]map[string]int
 		appliedModules = append(appliedModules, moduleName)
 
 		// Create shared networks for any modules this module references
-		if err := h.createSharedNetworksForReferences(moduleName, config); err != nil {
+		if err := h.createSharedNetworksForReferences(moduleName, refs[moduleName]); err != nil {
 			h.logger.Warn("Failed to create shared networks", "module", moduleName, "error", err)
 			// Don't fail the entire operation for network creation failures
 		}
@@ -516,24 +516,20 @@ func (h *LinkHandlers) linkApps(linkID string, modules map[string]map[string]int
 
 	// Parse references from module configurations and collect network names
 	networkNames := make(map[string]bool)
-	for moduleName, config := range modules {
-		appRefs := make(map[string]string)
-		for inputName, value := range config {
-			if ref, isRef := parseAppReference(value); isRef {
-				appRefs[inputName] = fmt.Sprintf("%s.%s", ref.FromModule, ref.Output)
-
-				// Generate the network name for this reference
-				linkModules := []string{ref.FromModule, moduleName}
-				if linkModules[0] > linkModules[1] {
-					linkModules[0], linkModules[1] = linkModules[1], linkModules[0]
-				}
-				networkName := fmt.Sprintf("zeropoint-link-%s-%s", linkModules[0], linkModules[1])
-				networkNames[networkName] = true
+	for moduleName, moduleRefs := range refs {
+		appRefs := make(map[string]string, len(moduleRefs))
+		for inputName, ref := range moduleRefs {
+			appRefs[inputName] = fmt.Sprintf("%s.%s", ref.FromModule, ref.Output)
+
+			// Generate the network name for this reference
+			linkModules := []string{ref.FromModule, moduleName}
+			if linkModules[0] > linkModules[1] {
+				linkModules[0], linkModules[1] = linkModules[1], linkModules[0]
 			}
+			networkName := fmt.Sprintf("zeropoint-link-%s-%s", linkModules[0], linkModules[1])
+			networkNames[networkName] = true
 		}
-		if len(appRefs) > 0 {
-			references[moduleName] = appRefs
-		}
+		references[moduleName] = appRefs
 	}
 
 	// Convert network names map to slice
@@ -563,7 +559,7 @@ func getAppNames(apps map[string]map[string]interface{}) []string {
 }
 
 // validateAppsExist checks that all referenced apps exist on disk
-func (h *LinkHandlers) validateAppsExist(apps map[string]map[string]interface{}) error {
+func (h *LinkHandlers) validateAppsExist(apps map[string]map[string]interface{}, refs LinkReferences) error {
 	for appName := range apps {
 		appDir := filepath.Join(h.appsDir, appName)
 		if _, err := os.Stat(appDir); os.IsNotExist(err) {
@@ -572,13 +568,11 @@ func (h *LinkHandlers) validateAppsExist(apps map[string]map[string]interface{})
 	}
 
 	// Also validate referenced modules in module references
-	for moduleName, config := range apps {
-		for inputName, value := range config {
-			if ref, isRef := parseAppReference(value); isRef {
-				refModuleDir := filepath.Join(h.appsDir, ref.FromModule)
-				if _, err := os.Stat(refModuleDir); os.IsNotExist(err) {
-					return fmt.Errorf("module %s references non-existent module %s in input %s", moduleName, ref.FromModule, inputName)
-				}
+	for moduleName, moduleRefs := range refs {
+		for inputName, ref := range moduleRefs {
+			refModuleDir := filepath.Join(h.appsDir, ref.FromModule)
+			if _, err := os.Stat(refModuleDir); os.IsNotExist(err) {
+				return fmt.Errorf("module %s references non-existent module %s in input %s", moduleName, ref.FromModule, inputName)
 			}
 		}
 	}
@@ -586,12 +580,16 @@ func (h *LinkHandlers) validateAppsExist(apps map[string]map[string]interface{})
 	return nil
 }
 
+// moduleOutputCache memoizes terraform outputs per module for one link operation,
+// so several references to the same module run `terraform output` only once
+type moduleOutputCache map[string]map[string]*terraform.OutputMeta
+
 // applyModuleConfiguration applies configuration to a single module
-func (h *LinkHandlers) applyModuleConfiguration(moduleName string, config map[string]interface{}) error {
+func (h *LinkHandlers) applyModuleConfiguration(moduleName string, config map[string]interface{}, refs map[string]AppReference, outputs moduleOutputCache) error {
 	h.logger.Info("Applying configuration to module", "module", moduleName)
 
 	// Resolve app references to actual values
-	resolvedConfig, err := h.resolveAppReferences(config)
+	resolvedConfig, err := h.resolveAppReferences(config, refs, outputs)
 	if err != nil {
 		return fmt.Errorf("failed to resolve references: %w", err)
 	}
@@ -638,18 +636,21 @@ func (h *LinkHandlers) applyModuleConfiguration(moduleName string, config map[st
 		return fmt.Errorf("terraform apply failed: %w", err)
 	}
 
+	// Outputs of this module may have changed; re-read them if referenced later
+	delete(outputs, moduleName)
+
 	h.logger.Info("Configuration applied successfully", "module", moduleName)
 	return nil
 }
 
 // resolveAppReferences resolves module references to actual output values
-func (h *LinkHandlers) resolveAppReferences(config map[string]interface{}) (map[string]interface{}, error) {
-	resolved := make(map[string]interface{})
+func (h *LinkHandlers) resolveAppReferences(config map[string]interface{}, refs map[string]AppReference, outputs moduleOutputCache) (map[string]interface{}, error) {
+	resolved := make(map[string]interface{}, len(config))
 
 	for key, value := range config {
-		if ref, isRef := parseAppReference(value); isRef {
+		if ref, isRef := refs[key]; isRef {
 			// Get the actual output value from the referenced module
-			resolvedValue, err := h.getAppOutput(ref.FromModule, ref.Output)
+			resolvedValue, err := h.getAppOutput(ref.FromModule, ref.Output, outputs)
 			if err != nil {
 				return nil, fmt.Errorf("failed to resolve reference %s.%s: %w", ref.FromModule, ref.Output, err)
 			}
@@ -664,17 +665,15 @@ func (h *LinkHandlers) resolveAppReferences(config map[string]interface{}) (map[
 }
 
 // getAppOutput retrieves an output value from an app's Terraform state
-func (h *LinkHandlers) getAppOutput(appName, outputName string) (interface{}, error) {
-	appDir := filepath.Join(h.appsDir, appName)
-
-	executor, err := terraform.NewExecutor(appDir)
-	if err != nil {
-		return nil, fmt.Errorf("failed to create terraform executor for app %s: %w", appName, err)
-	}
-
-	outputs, err := executor.Output()
-	if err != nil {
-		return nil, fmt.Errorf("failed to get terraform outputs for app %s: %w", appName, err)
+func (h *LinkHandlers) getAppOutput(appName, outputName string, cache moduleOutputCache) (interface{}, error) {
+	outputs, cached := cache[appName]
+	if !cached {
+		var err error
+		outputs, err = terraform.ReadOutputs(filepath.Join(h.appsDir, appName))
+		if err != nil {
+			return nil, fmt.Errorf("failed to get terraform outputs for app %s: %w", appName, err)
+		}
+		cache[appName] = outputs
 	}
 
 	output, exists := outputs[outputName]
@@ -726,18 +725,16 @@ func (h *LinkHandlers) prepareSystemVariables(moduleName string) (map[string]str
 }
 
 // createSharedNetworksForReferences creates shared networks for referenced modules
-func (h *LinkHandlers) createSharedNetworksForReferences(targetModule string, config map[string]interface{}) error {
+func (h *LinkHandlers) createSharedNetworksForReferences(targetModule string, refs map[string]AppReference) error {
 	ctx := context.Background()
 
-	for _, value := range config {
-		if ref, isRef := parseAppReference(value); isRef {
-			h.logger.Info("Creating shared network for module reference", "from", ref.FromModule, "to", targetModule, "output", ref.Output)
+	for _, ref := range refs {
+		h.logger.Info("Creating shared network for module reference", "from", ref.FromModule, "to", targetModule, "output", ref.Output)
 
-			// Create shared network for direct communication between linked modules
-			if err := h.ensureSharedNetwork(ctx, ref.FromModule, targetModule); err != nil {
-				h.logger.Warn("Failed to create shared network", "from", ref.FromModule, "to", targetModule, "error", err)
-				// Don't return error - network connection failure shouldn't break linking
-			}
+		// Create shared network for direct communication between linked modules
+		if err := h.ensureSharedNetwork(ctx, ref.FromModule, targetModule); err != nil {
+			h.logger.Warn("Failed to create shared network", "from", ref.FromModule, "to", targetModule, "error", err)
+			// Don't return error - network connection failure shouldn't break linking
 		}
 	}
 
@@ -767,12 +764,17 @@ func (h *LinkHandlers) ensureSharedNetwork(ctx context.Context, sourceApp, targe
 
 	h.logger.Info("Using shared network", "network", networkName, "apps", []string{sourceApp, targetApp})
 
-	// Connect both apps to the shared network using networkManager
-	if err := h.ensureAppOnSharedNetwork(ctx, sourceApp, networkName); err != nil {
+	// Resolve the network once, then connect both apps to it
+	networkID, err := h.networkManager.EnsureNetworkExists(ctx, networkName)
+	if err != nil {
+		return err
+	}
+
+	if err := h.networkManager.ConnectContainer(ctx, networkID, sourceApp+"-main"); err != nil {
 		return fmt.Errorf("failed to connect source app to shared network: %w", err)
 	}
 
-	if err := h.ensureAppOnSharedNetwork(ctx, targetApp, networkName); err != nil {
+	if err := h.networkManager.ConnectContainer(ctx, networkID, targetApp+"-main"); err != nil {
 		return fmt.Errorf("failed to connect target app to shared network: %w", err)
 	}
 
@@ -780,22 +782,9 @@ func (h *LinkHandlers) ensureSharedNetwork(ctx context.Context, sourceApp, targe
 	return nil
 }
 
-// ensureAppOnSharedNetwork connects an app's container to a shared network
-func (h *LinkHandlers) ensureAppOnSharedNetwork(ctx context.Context, appName, networkName string) error {
-	containerName := appName + "-main"
-	return h.networkManager.ConnectContainerToNetwork(ctx, containerName, networkName)
-}
-
 // getAppOutputs retrieves all output values from an app's Terraform state
 func (h *LinkHandlers) getAppOutputs(appName string) (map[string]interface{}, error) {
-	appDir := filepath.Join(h.appsDir, appName)
-
-	executor, err := terraform.NewExecutor(appDir)
-	if err != nil {
-		return nil, fmt.Errorf("failed to create terraform executor for app %s: %w", appName, err)
-	}
-
-	outputs, err := executor.Output()
+	outputs, err := terraform.ReadOutputs(filepath.Join(h.appsDir, appName))
 	if err != nil {
 		return nil, fmt.Errorf("failed to get terraform outputs for app %s: %w", appName, err)
 	}
@@ -985,10 +974,12 @@ func (h *ModuleHandlers) ListModules(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 	resp := ModulesResponse{Modules: list}
-	w.Header().Set("Content-Type", "application/json")
-	json.NewEncoder(w).Encode(resp)
+	writeJSONConditional(w, r, resp)
 }
 
+// discoverConcurrency bounds how many modules discoverModules loads at once
+const discoverConcurrency = 8
+
 // discoverModules scans the modules/ directory for installed modules
 func (h *ModuleHandlers) discoverModules(ctx context.Context) ([]Module, error) {
 	modulesDir := internalPaths.GetModulesDir()
@@ -1002,47 +993,75 @@ func (h *ModuleHandlers) discoverModules(ctx context.Context) ([]Module, error)
 		return nil, err
 	}
 
+	// List containers once for all modules rather than once per module
+	containerIndex, err := modules.ListContainers(ctx, h.docker)
+	if err != nil {
+		h.logger.Warn("failed to list containers", "error", err)
+	}
+
+	var moduleIDs []string
 	for _, entry := range entries {
 		if !entry.IsDir() {
 			continue
 		}
 
-		moduleID := entry.Name()
-		modulePath := filepath.Join(modulesDir, moduleID)
-
 		// Check if main.tf exists
-		mainTfPath := filepath.Join(modulePath, "main.tf")
+		mainTfPath := filepath.Join(modulesDir, entry.Name(), "main.tf")
 		if _, err := os.Stat(mainTfPath); err != nil {
 			continue // Not a valid module
 		}
+		moduleIDs = append(moduleIDs, entry.Name())
+	}
+	if len(moduleIDs) == 0 {
+		return result, nil
+	}
 
-		module := Module{
-			ID:         moduleID,
-			ModulePath: modulePath,
-			State:      modules.StateUnknown,
-		}
+	// Each module's metadata, inspect and Terraform outputs are independent, so
+	// load them concurrently, bounded so a large install can't fan out unchecked
+	result = make([]Module, len(moduleIDs))
+	sem := make(chan struct{}, discoverConcurrency)
+	var wg sync.WaitGroup
+	for i, moduleID := range moduleIDs {
+		wg.Add(1)
+		sem <- struct{}{}
+		go func(i int, moduleID string) {
+			defer wg.Done()
+			defer func() { <-sem }()
+			result[i] = h.loadModule(ctx, modulesDir, moduleID, containerIndex)
+		}(i, moduleID)
+	}
+	wg.Wait()
 
-		// Load metadata (including tags) from .zeropoint.json
-		if metadata, err := modules.LoadMetadata(modulePath); err != nil {
-			h.logger.Warn("failed to load metadata", "module_id", moduleID, "error", err)
-		} else if metadata != nil {
-			module.Tags = metadata.Tags
-		}
+	return result, nil
+}
 
-		// Query Docker for runtime status
-		if err := module.GetContainerStatus(ctx, h.docker); err != nil {
-			h.logger.Warn("failed to get container status", "module_id", moduleID, "error", err)
-		}
+// loadModule builds a Module from its directory, container status and Terraform outputs
+func (h *ModuleHandlers) loadModule(ctx context.Context, modulesDir, moduleID string, containerIndex modules.ContainerIndex) Module {
+	modulePath := filepath.Join(modulesDir, moduleID)
+	module := Module{
+		ID:         moduleID,
+		ModulePath: modulePath,
+		State:      modules.StateUnknown,
+	}
 
-		// Load containers with ports and mounts from Terraform outputs
-		if containers, err := modules.LoadContainers(modulePath, moduleID); err != nil {
-			h.logger.Warn("failed to load containers", "module_id", moduleID, "error", err)
-		} else {
-			module.Containers = containers
-		}
+	// Load metadata (including tags) from .zeropoint.json
+	if metadata, err := modules.LoadMetadata(modulePath); err != nil {
+		h.logger.Warn("failed to load metadata", "module_id", moduleID, "error", err)
+	} else if metadata != nil {
+		module.Tags = metadata.Tags
+	}
 
-		result = append(result, module)
+	// Query Docker for runtime status
+	if err := module.SetContainerStatus(ctx, h.docker, containerIndex); err != nil {
+		h.logger.Warn("failed to get container status", "module_id", moduleID, "error", err)
 	}
 
-	return result, nil
+	// Load containers with ports and mounts from Terraform outputs
+	if containers, err := modules.LoadContainers(modulePath, moduleID); err != nil {
+		h.logger.Warn("failed to load containers", "module_id", moduleID, "error", err)
+	} else {
+		module.Containers = containers
+	}
+
+	return module
 }
@@ -1,7 +1,6 @@
 package api
 
 import (
-	"encoding/json"
 	"fmt"
 	"log/slog"
 	"net/http"
@@ -91,17 +90,10 @@ func (h *InspectHandlers) InspectModule(w http.ResponseWriter, r *http.Request)
 		}
 	}
 
-	// Parse inputs
-	inputs, err := hcl.ParseModuleInputs(modulePath)
+	// Parse inputs and outputs from a single read of main.tf
+	inputs, outputs, err := hcl.ParseModule(modulePath)
 	if err != nil {
-		http.Error(w, fmt.Sprintf("failed to parse inputs: %v", err), http.StatusInternalServerError)
-		return
-	}
-
-	// Parse outputs
-	outputs, err := hcl.ParseModuleOutputs(modulePath)
-	if err != nil {
-		http.Error(w, fmt.Sprintf("failed to parse outputs: %v", err), http.StatusInternalServerError)
+		http.Error(w, fmt.Sprintf("failed to parse module: %v", err), http.StatusInternalServerError)
 		return
 	}
 
@@ -154,8 +146,7 @@ func (h *InspectHandlers) InspectModule(w http.ResponseWriter, r *http.Request)
 		response.Outputs[name] = schema
 	}
 
-	w.Header().Set("Content-Type", "application/json")
-	json.NewEncoder(w).Encode(response)
+	writeJSON(w, http.StatusOK, response)
 }
 
 // cloneModule clones a git repository to a temporary directory
@@ -187,10 +178,6 @@ func (h *InspectHandlers) getCurrentInputs(moduleID string) map[string]string {
 
 // getCurrentOutputs retrieves the current output values for an installed module
 func (h *InspectHandlers) getCurrentOutputs(modulePath string) (map[string]*terraform.OutputMeta, error) {
-	executor, err := terraform.NewExecutor(modulePath)
-	if err != nil {
-		return nil, err
-	}
-
-	return executor.Output()
+	// Read the local state directly rather than spawning `terraform output`
+	return terraform.ReadOutputs(modulePath)
 }
@@ -0,0 +1,66 @@
+package api
+
+import (
+	"bytes"
+	"encoding/json"
+	"fmt"
+	"hash/fnv"
+	"net/http"
+	"strconv"
+	"sync"
+)
+
+// maxPooledBufferSize keeps unusually large responses from pinning memory in the pool
+const maxPooledBufferSize = 1 << 20
+
+var jsonBufferPool = sync.Pool{
+	New: func() interface{} { return new(bytes.Buffer) },
+}
+
+// writeJSON encodes v into a pooled buffer and writes it with a single Write
+// and an explicit Content-Length, rather than streaming through json.Encoder
+// (which falls back to chunked encoding and several small writes).
+// Encoding errors are reported as 500 since nothing has been sent yet.
+func writeJSON(w http.ResponseWriter, status int, v interface{}) {
+	writeJSONResponse(w, nil, status, v)
+}
+
+// writeJSONConditional is writeJSON for polled GET endpoints: the body is
+// tagged with an ETag and a matching If-None-Match is answered with 304 and
+// no body, so pollers only download and re-parse state that changed.
+func writeJSONConditional(w http.ResponseWriter, r *http.Request, v interface{}) {
+	writeJSONResponse(w, r, http.StatusOK, v)
+}
+
+func writeJSONResponse(w http.ResponseWriter, r *http.Request, status int, v interface{}) {
+	buf := jsonBufferPool.Get().(*bytes.Buffer)
+	buf.Reset()
+	defer func() {
+		if buf.Cap() <= maxPooledBufferSize {
+			jsonBufferPool.Put(buf)
+		}
+	}()
+
+	if err := json.NewEncoder(buf).Encode(v); err != nil {
+		http.Error(w, "failed to encode response", http.StatusInternalServerError)
+		return
+	}
+
+	if r != nil {
+		h := fnv.New64a()
+		h.Write(buf.Bytes())
+		etag := fmt.Sprintf(`"%x"`, h.Sum64())
+
+		w.Header().Set("ETag", etag)
+		w.Header().Set("Cache-Control", "no-cache")
+		if r.Header.Get("If-None-Match") == etag {
+			w.WriteHeader(http.StatusNotModified)
+			return
+		}
+	}
+
+	w.Header().Set("Content-Type", "application/json")
+	w.Header().Set("Content-Length", strconv.Itoa(buf.Len()))
+	w.WriteHeader(status)
+	w.Write(buf.Bytes())
+}
@@ -9,6 +9,8 @@ import (
 	"os"
 	"path/filepath"
 	"strings"
+	"sync"
+	"time"
 
 	internalPaths "zeropoint-agent/internal"
 	"zeropoint-agent/internal/boot"
@@ -30,8 +32,20 @@ type apiEnv struct {
 	boot      *BootHandlers
 	queue     *queue.Handlers
 	logger    *slog.Logger
+
+	// Last docker ping result, reused by /health for healthCacheTTL
+	healthMu        sync.Mutex
+	healthCheckedAt time.Time
+	healthErr       error
 }
 
+const (
+	// healthCacheTTL bounds how often /health actually pings the docker daemon
+	healthCacheTTL = 2 * time.Second
+	// healthPingTimeout keeps a wedged daemon from hanging health probes
+	healthPingTimeout = 2 * time.Second
+)
+
 // HealthResponse is returned by GET /health
 type HealthResponse struct {
 	Status string `json:"status"`
@@ -124,66 +138,70 @@ func NewRouter(dockerClient *client.Client, xdsServer *xds.Server, mdnsService M
 		})
 	}
 
-	// API routes MUST be registered before the static file server
+	// API routes MUST be registered before the static file server. They live
+	// on a /api subrouter so static asset requests are rejected by a single
+	// prefix check instead of being tested against every API route pattern.
+	apiRouter := r.PathPrefix("/api").Subrouter()
+
 	// Health endpoint
-	r.HandleFunc("/api/health", env.healthHandler).Methods(http.MethodGet)
+	apiRouter.HandleFunc("/health", env.healthHandler).Methods(http.MethodGet)
 
 	// Boot monitoring endpoints (always available)
-	r.HandleFunc("/api/boot/status", bootHandlers.HandleBootStatus).Methods(http.MethodGet)
-	r.HandleFunc("/api/boot/logs", bootHandlers.HandleBootLogs).Methods(http.MethodGet)
-	r.HandleFunc("/api/boot/stream", bootHandlers.HandleBootStream)
+	apiRouter.HandleFunc("/boot/status", bootHandlers.HandleBootStatus).Methods(http.MethodGet)
+	apiRouter.HandleFunc("/boot/logs", bootHandlers.HandleBootLogs).Methods(http.MethodGet)
+	apiRouter.HandleFunc("/boot/stream", bootHandlers.HandleBootStream)
 	// Per-service and marker endpoints
-	r.HandleFunc("/api/boot/status/{service}", bootHandlers.HandleBootService).Methods(http.MethodGet)
-	r.HandleFunc("/api/boot/status/{service}/{marker}", bootHandlers.HandleBootMarker).Methods(http.MethodGet)
+	apiRouter.HandleFunc("/boot/status/{service}", bootHandlers.HandleBootService).Methods(http.MethodGet)
+	apiRouter.HandleFunc("/boot/status/{service}/{marker}", bootHandlers.HandleBootMarker).Methods(http.MethodGet)
 
 	// Module endpoints
-	r.HandleFunc("/api/modules", moduleHandlers.ListModules).Methods(http.MethodGet)
-	r.HandleFunc("/api/modules/{name}", moduleHandlers.InstallModule).Methods(http.MethodPost)
-	r.HandleFunc("/api/modules/{name}", moduleHandlers.UninstallModule).Methods(http.MethodDelete)
-	r.HandleFunc("/api/modules/{module_id}/inspect", inspectHandlers.InspectModule).Methods(http.MethodGet)
+	apiRouter.HandleFunc("/modules", moduleHandlers.ListModules).Methods(http.MethodGet)
+	apiRouter.HandleFunc("/modules/{name}", moduleHandlers.InstallModule).Methods(http.MethodPost)
+	apiRouter.HandleFunc("/modules/{name}", moduleHandlers.UninstallModule).Methods(http.MethodDelete)
+	apiRouter.HandleFunc("/modules/{module_id}/inspect", inspectHandlers.InspectModule).Methods(http.MethodGet)
 
 	// Link endpoints
-	r.HandleFunc("/api/links", linkHandlers.ListLinks).Methods(http.MethodGet)
-	r.HandleFunc("/api/links/{id}", linkHandlers.GetLink).Methods(http.MethodGet)
-	r.HandleFunc("/api/links/{id}", linkHandlers.CreateOrUpdateLink).Methods(http.MethodPost)
-	r.HandleFunc("/api/links/{id}", linkHandlers.DeleteLinkHTTP).Methods(http.MethodDelete)
+	apiRouter.HandleFunc("/links", linkHandlers.ListLinks).Methods(http.MethodGet)
+	apiRouter.HandleFunc("/links/{id}", linkHandlers.GetLink).Methods(http.MethodGet)
+	apiRouter.HandleFunc("/links/{id}", linkHandlers.CreateOrUpdateLink).Methods(http.MethodPost)
+	apiRouter.HandleFunc("/links/{id}", linkHandlers.DeleteLinkHTTP).Methods(http.MethodDelete)
 
 	// Exposure endpoints
-	r.HandleFunc("/api/exposures", exposureHandlers.ListExposures).Methods(http.MethodGet)
-	r.HandleFunc("/api/exposures/{exposure_id}", exposureHandlers.CreateExposureHTTP).Methods(http.MethodPost)
-	r.HandleFunc("/api/exposures/{exposure_id}", exposureHandlers.GetExposure).Methods(http.MethodGet)
-	r.HandleFunc("/api/exposures/{exposure_id}", exposureHandlers.DeleteExposureHTTP).Methods(http.MethodDelete)
+	apiRouter.HandleFunc("/exposures", exposureHandlers.ListExposures).Methods(http.MethodGet)
+	apiRouter.HandleFunc("/exposures/{exposure_id}", exposureHandlers.CreateExposureHTTP).Methods(http.MethodPost)
+	apiRouter.HandleFunc("/exposures/{exposure_id}", exposureHandlers.GetExposure).Methods(http.MethodGet)
+	apiRouter.HandleFunc("/exposures/{exposure_id}", exposureHandlers.DeleteExposureHTTP).Methods(http.MethodDelete)
 
 	// Bundle endpoints
-	r.HandleFunc("/api/bundles", bundleHandlers.ListBundles).Methods(http.MethodGet)
-	r.HandleFunc("/api/bundles/{bundle-id}", bundleHandlers.GetBundle).Methods(http.MethodGet)
-	r.HandleFunc("/api/bundles/{bundle-id}", bundleHandlers.DeleteBundle).Methods(http.MethodDelete)
+	apiRouter.HandleFunc("/bundles", bundleHandlers.ListBundles).Methods(http.MethodGet)
+	apiRouter.HandleFunc("/bundles/{bundle-id}", bundleHandlers.GetBundle).Methods(http.MethodGet)
+	apiRouter.HandleFunc("/bundles/{bundle-id}", bundleHandlers.DeleteBundle).Methods(http.MethodDelete)
 
 	// Catalog endpoints
-	r.HandleFunc("/api/catalogs/update", catalogHandlers.HandleUpdateCatalog).Methods(http.MethodPost)
-	r.HandleFunc("/api/catalogs/modules", catalogHandlers.HandleListModules).Methods(http.MethodGet)
-	r.HandleFunc("/api/catalogs/modules/{module_name}", catalogHandlers.HandleGetModule).Methods(http.MethodGet)
-	r.HandleFunc("/api/catalogs/bundles", catalogHandlers.HandleListBundles).Methods(http.MethodGet)
-	r.HandleFunc("/api/catalogs/bundles/{bundle_name}", catalogHandlers.HandleGetBundle).Methods(http.MethodGet)
+	apiRouter.HandleFunc("/catalogs/update", catalogHandlers.HandleUpdateCatalog).Methods(http.MethodPost)
+	apiRouter.HandleFunc("/catalogs/modules", catalogHandlers.HandleListModules).Methods(http.MethodGet)
+	apiRouter.HandleFunc("/catalogs/modules/{module_name}", catalogHandlers.HandleGetModule).Methods(http.MethodGet)
+	apiRouter.HandleFunc("/catalogs/bundles", catalogHandlers.HandleListBundles).Methods(http.MethodGet)
+	apiRouter.HandleFunc("/catalogs/bundles/{bundle_name}", catalogHandlers.HandleGetBundle).Methods(http.MethodGet)
 
 	// Job Queue endpoints
-	r.HandleFunc("/api/jobs", queueHandlers.ListJobs).Methods(http.MethodGet)
-	r.HandleFunc("/api/jobs", queueHandlers.DeleteJobs).Methods(http.MethodDelete)
-	r.HandleFunc("/api/jobs/{id}", queueHandlers.GetJob).Methods(http.MethodGet)
-	r.HandleFunc("/api/jobs/{id}", queueHandlers.CancelJob).Methods(http.MethodDelete)
-	r.HandleFunc("/api/jobs/enqueue_install_module", queueHandlers.EnqueueInstall).Methods(http.MethodPost)
-	r.HandleFunc("/api/jobs/enqueue_uninstall_module", queueHandlers.EnqueueUninstall).Methods(http.MethodPost)
-	r.HandleFunc("/api/jobs/enqueue_create_exposure", queueHandlers.EnqueueCreateExposure).Methods(http.MethodPost)
-	r.HandleFunc("/api/jobs/enqueue_delete_exposure", queueHandlers.EnqueueDeleteExposure).Methods(http.MethodPost)
-	r.HandleFunc("/api/jobs/enqueue_create_link", queueHandlers.EnqueueCreateLink).Methods(http.MethodPost)
-	r.HandleFunc("/api/jobs/enqueue_delete_link", queueHandlers.EnqueueDeleteLink).Methods(http.MethodPost)
-	r.HandleFunc("/api/jobs/enqueue_install_bundle", queueHandlers.EnqueueBundleInstall).Methods(http.MethodPost)
-	r.HandleFunc("/api/jobs/enqueue_uninstall_bundle", queueHandlers.EnqueueBundleUninstall).Methods(http.MethodPost)
+	apiRouter.HandleFunc("/jobs", queueHandlers.ListJobs).Methods(http.MethodGet)
+	apiRouter.HandleFunc("/jobs", queueHandlers.DeleteJobs).Methods(http.MethodDelete)
+	apiRouter.HandleFunc("/jobs/{id}", queueHandlers.GetJob).Methods(http.MethodGet)
+	apiRouter.HandleFunc("/jobs/{id}", queueHandlers.CancelJob).Methods(http.MethodDelete)
+	apiRouter.HandleFunc("/jobs/enqueue_install_module", queueHandlers.EnqueueInstall).Methods(http.MethodPost)
+	apiRouter.HandleFunc("/jobs/enqueue_uninstall_module", queueHandlers.EnqueueUninstall).Methods(http.MethodPost)
+	apiRouter.HandleFunc("/jobs/enqueue_create_exposure", queueHandlers.EnqueueCreateExposure).Methods(http.MethodPost)
+	apiRouter.HandleFunc("/jobs/enqueue_delete_exposure", queueHandlers.EnqueueDeleteExposure).Methods(http.MethodPost)
+	apiRouter.HandleFunc("/jobs/enqueue_create_link", queueHandlers.EnqueueCreateLink).Methods(http.MethodPost)
+	apiRouter.HandleFunc("/jobs/enqueue_delete_link", queueHandlers.EnqueueDeleteLink).Methods(http.MethodPost)
+	apiRouter.HandleFunc("/jobs/enqueue_install_bundle", queueHandlers.EnqueueBundleInstall).Methods(http.MethodPost)
+	apiRouter.HandleFunc("/jobs/enqueue_uninstall_bundle", queueHandlers.EnqueueBundleUninstall).Methods(http.MethodPost)
 
 	// Web UI - serve static files as fallback after API routes
 	webDir := getWebDir()
 	if webDir != "" {
-		r.PathPrefix("/").Handler(http.FileServer(http.Dir(webDir)))
+		r.PathPrefix("/").Handler(newStaticHandler(webDir, logger))
 	}
 
 	// Create router with middleware for boot checking
@@ -211,31 +229,44 @@ func NewRouter(dockerClient *client.Client, xdsServer *xds.Server, mdnsService M
 // @Failure 503 {object} HealthResponse "Docker unavailable"
 // @Router /health [get]
 func (e *apiEnv) healthHandler(w http.ResponseWriter, r *http.Request) {
-	ctx := r.Context()
 	// Basic health: server alive and can reach docker daemon
 	resp := HealthResponse{Status: "ok"}
 	if e.docker != nil {
-		if _, err := e.docker.Ping(ctx, client.PingOptions{}); err != nil {
-			w.WriteHeader(http.StatusServiceUnavailable)
+		if err := e.pingDocker(); err != nil {
 			resp.Status = "docker_unavailable"
 			resp.Error = err.Error()
-			json.NewEncoder(w).Encode(resp)
+			writeJSON(w, http.StatusServiceUnavailable, resp)
 			return
 		}
 	}
-	w.Header().Set("Content-Type", "application/json")
-	json.NewEncoder(w).Encode(resp)
+	writeJSON(w, http.StatusOK, resp)
 }
 
-// getWebDir finds the web UI directory
-func getWebDir() string {
-	// Try relative to executable
-	if webDir := "web"; fileExists(webDir) {
-		return webDir
+// pingDocker pings the docker daemon, reusing a recent result so frequent
+// health probes don't each cost a daemon round trip. Concurrent callers
+// wait on the mutex and share one ping, which is why it is not tied to any
+// single request's context.
+func (e *apiEnv) pingDocker() error {
+	e.healthMu.Lock()
+	defer e.healthMu.Unlock()
+
+	if !e.healthCheckedAt.IsZero() && time.Since(e.healthCheckedAt) < healthCacheTTL {
+		return e.healthErr
 	}
 
+	pingCtx, cancel := context.WithTimeout(context.Background(), healthPingTimeout)
+	defer cancel()
+
+	_, err := e.docker.Ping(pingCtx, client.PingOptions{})
+	e.healthErr = err
+	e.healthCheckedAt = time.Now()
+	return err
+}
+
+// getWebDir finds the web UI directory
+func getWebDir() string {
 	// Try relative to working directory
-	if webDir := filepath.Join(".", "web"); fileExists(webDir) {
+	if webDir := "web"; fileExists(webDir) {
 		return webDir
 	}
 
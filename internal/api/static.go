@@ -0,0 +1,152 @@
+package api
+
+import (
+	"bytes"
+	"crypto/sha256"
+	"encoding/hex"
+	"io/fs"
+	"log/slog"
+	"net/http"
+	"os"
+	"path"
+	"path/filepath"
+	"sync"
+	"time"
+)
+
+// maxPreloadFileSize bounds which web assets are held in memory
+const maxPreloadFileSize = 4 << 20
+
+// staticFile is a preloaded web asset
+type staticFile struct {
+	path    string // file on disk
+	name    string
+	data    []byte
+	etag    string
+	size    int64
+	modTime time.Time
+}
+
+// staticHandler serves the web UI from memory with ETag revalidation.
+// Assets are preloaded at startup and each request only stats the file to
+// check it is unchanged (a rebuild, e.g. `webpack --watch`, rewrites them in
+// place), so repeat requests skip reading the file and are answered with 304
+// when the client copy is current. Anything not preloaded, or no longer on
+// disk, is passed to a regular file server.
+type staticHandler struct {
+	mu       sync.RWMutex
+	files    map[string]*staticFile // URL path -> asset
+	fallback http.Handler
+}
+
+// newStaticHandler preloads the assets under webDir
+func newStaticHandler(webDir string, logger *slog.Logger) http.Handler {
+	h := &staticHandler{
+		files:    make(map[string]*staticFile),
+		fallback: http.FileServer(http.Dir(webDir)),
+	}
+
+	err := filepath.WalkDir(webDir, func(filePath string, d fs.DirEntry, err error) error {
+		if err != nil || d.IsDir() {
+			return err
+		}
+
+		info, err := d.Info()
+		if err != nil || !info.Mode().IsRegular() || info.Size() > maxPreloadFileSize {
+			return nil
+		}
+
+		rel, err := filepath.Rel(webDir, filePath)
+		if err != nil {
+			return nil
+		}
+
+		file, err := loadStaticFile(filePath, info)
+		if err != nil {
+			return nil
+		}
+		urlPath := "/" + filepath.ToSlash(rel)
+		h.files[urlPath] = file
+		if path.Base(urlPath) == "index.html" {
+			dirPath := path.Dir(urlPath)
+			if dirPath != "/" {
+				dirPath += "/"
+			}
+			h.files[dirPath] = file
+		}
+		return nil
+	})
+	if err != nil {
+		logger.Warn("failed to preload web UI assets, serving from disk", "dir", webDir, "error", err)
+	}
+
+	return h
+}
+
+// loadStaticFile reads an asset into memory; info is the file's current stat
+func loadStaticFile(filePath string, info os.FileInfo) (*staticFile, error) {
+	data, err := os.ReadFile(filePath)
+	if err != nil {
+		return nil, err
+	}
+
+	sum := sha256.Sum256(data)
+	return &staticFile{
+		path:    filePath,
+		name:    info.Name(),
+		data:    data,
+		etag:    `"` + hex.EncodeToString(sum[:16]) + `"`,
+		size:    info.Size(),
+		modTime: info.ModTime(),
+	}, nil
+}
+
+// currentFile returns the preloaded asset for urlPath, reloading it if the
+// file's size or mtime changed on disk. It returns nil if the path was not
+// preloaded or the file can no longer be loaded.
+func (h *staticHandler) currentFile(urlPath string) *staticFile {
+	h.mu.RLock()
+	file, ok := h.files[urlPath]
+	h.mu.RUnlock()
+	if !ok {
+		return nil
+	}
+
+	info, err := os.Stat(file.path)
+	if err != nil || !info.Mode().IsRegular() || info.Size() > maxPreloadFileSize {
+		return nil
+	}
+	if info.Size() == file.size && info.ModTime().Equal(file.modTime) {
+		return file
+	}
+
+	reloaded, err := loadStaticFile(file.path, info)
+	if err != nil {
+		return nil
+	}
+
+	h.mu.Lock()
+	h.files[urlPath] = reloaded
+	h.mu.Unlock()
+	return reloaded
+}
+
+// ServeHTTP serves a preloaded asset or defers to the file server
+func (h *staticHandler) ServeHTTP(w http.ResponseWriter, r *http.Request) {
+	if r.Method != http.MethodGet && r.Method != http.MethodHead {
+		h.fallback.ServeHTTP(w, r)
+		return
+	}
+
+	file := h.currentFile(r.URL.Path)
+	if file == nil {
+		h.fallback.ServeHTTP(w, r)
+		return
+	}
+
+	// Asset names are not content-hashed, so clients must revalidate;
+	// the ETag turns that into a 304 without a body.
+	w.Header().Set("ETag", file.etag)
+	w.Header().Set("Cache-Control", "no-cache")
+	http.ServeContent(w, r, file.name, file.modTime, bytes.NewReader(file.data))
+}
@@ -0,0 +1,135 @@
+package api
+
+import (
+	"io"
+	"log/slog"
+	"net/http"
+	"net/http/httptest"
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+)
+
+func TestStaticHandler(t *testing.T) {
+	webDir := t.TempDir()
+	files := map[string]string{
+		"index.html":      "<html>root</html>",
+		"assets/app.js":   "console.log('app')",
+		"docs/index.html": "<html>docs</html>",
+	}
+	for name, content := range files {
+		path := filepath.Join(webDir, name)
+		if err := os.MkdirAll(filepath.Dir(path), 0755); err != nil {
+			t.Fatal(err)
+		}
+		if err := os.WriteFile(path, []byte(content), 0644); err != nil {
+			t.Fatal(err)
+		}
+	}
+
+	h := newStaticHandler(webDir, slog.New(slog.NewTextHandler(io.Discard, nil)))
+	etags := make(map[string]string)
+
+	tests := []struct {
+		name        string
+		method      string
+		path        string
+		ifNoneMatch string // URL path whose ETag is sent back
+		wantStatus  int
+		wantBody    string
+		wantETag    bool
+	}{
+		{name: "root index", method: http.MethodGet, path: "/", wantStatus: http.StatusOK, wantBody: files["index.html"], wantETag: true},
+		{name: "nested asset", method: http.MethodGet, path: "/assets/app.js", wantStatus: http.StatusOK, wantBody: files["assets/app.js"], wantETag: true},
+		{name: "directory index", method: http.MethodGet, path: "/docs/", wantStatus: http.StatusOK, wantBody: files["docs/index.html"], wantETag: true},
+		{name: "revalidation", method: http.MethodGet, path: "/assets/app.js", ifNoneMatch: "/assets/app.js", wantStatus: http.StatusNotModified, wantETag: true},
+		{name: "missing file falls back", method: http.MethodGet, path: "/missing.js", wantStatus: http.StatusNotFound},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			req := httptest.NewRequest(tt.method, tt.path, nil)
+			if tt.ifNoneMatch != "" {
+				req.Header.Set("If-None-Match", etags[tt.ifNoneMatch])
+			}
+			rec := httptest.NewRecorder()
+			h.ServeHTTP(rec, req)
+
+			if rec.Code != tt.wantStatus {
+				t.Fatalf("status = %d, want %d", rec.Code, tt.wantStatus)
+			}
+			if tt.wantBody != "" && rec.Body.String() != tt.wantBody {
+				t.Errorf("body = %q, want %q", rec.Body.String(), tt.wantBody)
+			}
+			etag := rec.Header().Get("ETag")
+			if tt.wantETag && etag == "" {
+				t.Errorf("missing ETag header")
+			}
+			if etag != "" {
+				etags[tt.path] = etag
+			}
+		})
+	}
+}
+
+func TestStaticHandlerReloadsChangedFiles(t *testing.T) {
+	webDir := t.TempDir()
+	appPath := filepath.Join(webDir, "app.js")
+	writeAsset := func(content string, modTime time.Time) {
+		t.Helper()
+		if err := os.WriteFile(appPath, []byte(content), 0644); err != nil {
+			t.Fatal(err)
+		}
+		if err := os.Chtimes(appPath, modTime, modTime); err != nil {
+			t.Fatal(err)
+		}
+	}
+
+	base := time.Now().Add(-time.Hour).Truncate(time.Second)
+	writeAsset("console.log('v1')", base)
+	h := newStaticHandler(webDir, slog.New(slog.NewTextHandler(io.Discard, nil)))
+
+	get := func() *httptest.ResponseRecorder {
+		rec := httptest.NewRecorder()
+		h.ServeHTTP(rec, httptest.NewRequest(http.MethodGet, "/app.js", nil))
+		return rec
+	}
+
+	first := get()
+	if first.Code != http.StatusOK || first.Body.String() != "console.log('v1')" {
+		t.Fatalf("initial response = %d %q", first.Code, first.Body.String())
+	}
+
+	steps := []struct {
+		name     string
+		content  string
+		modTime  time.Time
+		wantBody string
+	}{
+		// Same size as v1, so only the mtime reveals the rebuild
+		{name: "rebuilt with same size", content: "console.log('v2')", modTime: base.Add(time.Minute), wantBody: "console.log('v2')"},
+		{name: "rebuilt with new size", content: "console.log('v3 larger')", modTime: base.Add(2 * time.Minute), wantBody: "console.log('v3 larger')"},
+	}
+
+	etag := first.Header().Get("ETag")
+	for _, step := range steps {
+		writeAsset(step.content, step.modTime)
+		rec := get()
+		if rec.Code != http.StatusOK || rec.Body.String() != step.wantBody {
+			t.Fatalf("%s: response = %d %q, want %q", step.name, rec.Code, rec.Body.String(), step.wantBody)
+		}
+		if newETag := rec.Header().Get("ETag"); newETag == "" || newETag == etag {
+			t.Errorf("%s: ETag = %q, want a new ETag (previous %q)", step.name, newETag, etag)
+		} else {
+			etag = newETag
+		}
+	}
+
+	if err := os.Remove(appPath); err != nil {
+		t.Fatal(err)
+	}
+	if rec := get(); rec.Code != http.StatusNotFound {
+		t.Errorf("deleted file: status = %d, want %d", rec.Code, http.StatusNotFound)
+	}
+}
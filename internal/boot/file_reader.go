@@ -91,13 +91,13 @@ func (m *BootMonitor) parseBootLogLine(line string) *LogEntry {
 	rest = strings.TrimSpace(rest)
 
 	// Split on colon to get service and message
-	parts := strings.SplitN(rest, ":", 2)
-	if len(parts) < 2 {
+	service, message, found := strings.Cut(rest, ":")
+	if !found {
 		return nil
 	}
 
-	service := strings.TrimSpace(parts[0])
-	message := strings.TrimSpace(parts[1])
+	service = strings.TrimSpace(service)
+	message = strings.TrimSpace(message)
 
 	// Extract priority level from [notice], [warn], [err] format
 	// Format: "[notice] step-name" or "[warn] step-name" or "[err] step-name"
@@ -143,13 +143,14 @@ func (m *BootMonitor) loadPersistentMarkers() {
 			svcName := strings.TrimSuffix(serviceName, ".error")
 			markerPath := filepath.Join(m.markerDir, filename)
 			errorDetails := m.readMarkerFile(markerPath)
+			markedAt := markerTime(entry, now)
 
 			m.services[svcName] = &ServiceStatus{
 				Name:        svcName,
 				Phase:       "boot",
 				State:       "failed",
-				StartedAt:   &now,
-				CompletedAt: &now,
+				StartedAt:   &markedAt,
+				CompletedAt: &markedAt,
 				Steps:       []string{"error"},
 				Error:       errorDetails,
 			}
@@ -166,12 +167,13 @@ func (m *BootMonitor) loadPersistentMarkers() {
 
 			// If service not yet loaded, create it
 			if _, exists := m.services[svcName]; !exists {
+				markedAt := markerTime(entry, now)
 				m.services[svcName] = &ServiceStatus{
 					Name:        svcName,
 					Phase:       "boot",
 					State:       "completed",
-					StartedAt:   &now,
-					CompletedAt: &now,
+					StartedAt:   &markedAt,
+					CompletedAt: &markedAt,
 					Steps:       []string{"warning"},
 				}
 			}
@@ -226,6 +228,17 @@ func (m *BootMonitor) loadPersistentMarkers() {
 	}
 }
 
+// markerTime returns when a marker file was written, or fallback if it can't be
+// read. Markers are reloaded on every FIFO reopen, so using the file's mtime
+// rather than the load time keeps the reported service timestamps stable.
+func markerTime(entry os.DirEntry, fallback time.Time) time.Time {
+	info, err := entry.Info()
+	if err != nil {
+		return fallback
+	}
+	return info.ModTime()
+}
+
 // readMarkerFile reads the contents of a marker file
 func (m *BootMonitor) readMarkerFile(path string) string {
 	data, err := os.ReadFile(path)
@@ -303,12 +316,14 @@ func (m *BootMonitor) Subscribe() <-chan StatusUpdate {
 
 // broadcastUpdate sends a StatusUpdate to all subscribers
 func (m *BootMonitor) broadcastUpdate(update StatusUpdate) {
-	m.mu.Lock()
-	subs := make(map[int]chan StatusUpdate)
-	for k, v := range m.subscribers {
-		subs[k] = v
+	// Copying the subscriber list only reads shared state, so a read lock lets
+	// broadcasts run alongside status and log readers
+	m.mu.RLock()
+	subs := make([]chan StatusUpdate, 0, len(m.subscribers))
+	for _, ch := range m.subscribers {
+		subs = append(subs, ch)
 	}
-	m.mu.Unlock()
+	m.mu.RUnlock()
 
 	for _, ch := range subs {
 		select {
@@ -457,9 +472,16 @@ func (m *BootMonitor) GetLogsByService(service string) []LogEntry {
 	m.mu.RLock()
 	defer m.mu.RUnlock()
 
+	// Unfiltered: copy in one allocation rather than growing the result
+	if service == "" {
+		result := make([]LogEntry, len(m.allLogs))
+		copy(result, m.allLogs)
+		return result
+	}
+
 	var result []LogEntry
 	for _, log := range m.allLogs {
-		if service == "" || log.Service == service {
+		if log.Service == service {
 			result = append(result, log)
 		}
 	}
@@ -486,7 +508,7 @@ func (m *BootMonitor) GetServiceStatuses() []ServiceMarkers {
 	m.mu.RLock()
 	defer m.mu.RUnlock()
 
-	result := make([]ServiceMarkers, 0)
+	result := make([]ServiceMarkers, 0, m.markers.Len())
 	for el := m.markers.Oldest(); el != nil; el = el.Next() {
 		// Make a fresh copy of the markers slice so callers get a snapshot
 		// that won't be aliased to the internal storage.
@@ -107,7 +107,7 @@ func (h *Handlers) HandleListModules(w http.ResponseWriter, r *http.Request) {
 	}
 
 	// Convert to module responses
-	var responses []ModuleResponse
+	responses := make([]ModuleResponse, 0, len(modules))
 	for _, module := range modules {
 		responses = append(responses, ModuleResponse{
 			Name:        module.Name,
@@ -158,7 +158,7 @@ func (h *Handlers) HandleListBundles(w http.ResponseWriter, r *http.Request) {
 	}
 
 	// Convert to bundle responses
-	var responses []BundleResponse
+	responses := make([]BundleResponse, 0, len(bundles))
 	for _, bundle := range bundles {
 		responses = append(responses, BundleResponse{
 			Name:        bundle.Name,
@@ -6,6 +6,7 @@ import (
 	"os"
 	"os/exec"
 	"path/filepath"
+	"strings"
 	"sync"
 
 	internalPaths "zeropoint-agent/internal"
@@ -25,6 +26,24 @@ type Store struct {
 	catalogPath string
 	logger      *slog.Logger
 	mutex       sync.RWMutex
+	updateMutex sync.Mutex // guards inflight
+	inflight    *updateCall
+
+	// Parsed catalog, each kind loaded on its first read and dropped on Update
+	modulesLoaded bool
+	modules       []CatalogModule
+	moduleIndex   map[string]int   // file name (without .yaml) -> index into modules
+	moduleErrs    map[string]error // file name (without .yaml) -> parse error
+	bundlesLoaded bool
+	bundles       []CatalogBundle
+	bundleIndex   map[string]int   // file name (without .yaml) -> index into bundles
+	bundleErrs    map[string]error // file name (without .yaml) -> parse error
+}
+
+// updateCall tracks an in-progress catalog update shared by concurrent callers
+type updateCall struct {
+	done chan struct{}
+	err  error
 }
 
 // NewStore creates a new catalog store
@@ -35,35 +54,87 @@ func NewStore(logger *slog.Logger) *Store {
 	}
 }
 
-// Update clones or pulls the latest catalog from the remote repository
+// Update clones or pulls the latest catalog from the remote repository.
+// Concurrent callers are coalesced onto a single in-flight update and all
+// receive its result.
 func (s *Store) Update() error {
-	s.mutex.Lock()
-	defer s.mutex.Unlock()
+	s.updateMutex.Lock()
+	if call := s.inflight; call != nil {
+		s.updateMutex.Unlock()
+		s.logger.Debug("catalog update already in progress, waiting for it")
+		<-call.done
+		return call.err
+	}
+	call := &updateCall{done: make(chan struct{})}
+	s.inflight = call
+	s.updateMutex.Unlock()
+
+	call.err = s.update()
 
+	s.updateMutex.Lock()
+	s.inflight = nil
+	s.updateMutex.Unlock()
+	close(call.done)
+
+	return call.err
+}
+
+// update performs the clone or pull. Network transfers run without holding
+// the store lock so catalog reads are not blocked behind a slow clone or
+// fetch; only the local swap/merge does.
+func (s *Store) update() error {
 	s.logger.Info("updating catalog", "path", s.catalogPath)
 
 	// Check if catalog directory exists
 	if _, err := os.Stat(s.catalogPath); os.IsNotExist(err) {
-		// Clone the catalog
+		// Clone into a staging directory, then move it into place
 		s.logger.Info("cloning catalog repository", "url", defaultCatalogURL)
-		cmd := exec.Command("git", "clone", defaultCatalogURL, s.catalogPath)
-		cmd.Stdout = os.Stdout
+		stagingPath := s.catalogPath + ".tmp"
+		if err := os.RemoveAll(stagingPath); err != nil {
+			return fmt.Errorf("failed to clean catalog staging directory: %w", err)
+		}
+
+		// Stdout is left unset (discarded): git's progress/summary output is not
+		// used and would otherwise interleave with the JSON log stream
+		cmd := exec.Command("git", "clone", defaultCatalogURL, stagingPath)
 		cmd.Stderr = os.Stderr
 
 		if err := cmd.Run(); err != nil {
+			os.RemoveAll(stagingPath)
 			return fmt.Errorf("failed to clone catalog: %w", err)
 		}
+
+		s.mutex.Lock()
+		err := os.Rename(stagingPath, s.catalogPath)
+		s.invalidate()
+		s.mutex.Unlock()
+		if err != nil {
+			os.RemoveAll(stagingPath)
+			return fmt.Errorf("failed to move catalog into place: %w", err)
+		}
 	} else {
-		// Pull latest changes
+		// Fetch latest changes
 		s.logger.Info("pulling catalog updates")
-		cmd := exec.Command("git", "pull")
+		cmd := exec.Command("git", "fetch")
 		cmd.Dir = s.catalogPath
-		cmd.Stdout = os.Stdout
 		cmd.Stderr = os.Stderr
 
 		if err := cmd.Run(); err != nil {
 			return fmt.Errorf("failed to pull catalog updates: %w", err)
 		}
+
+		// Merge the fetched changes (local only)
+		cmd = exec.Command("git", "merge", "FETCH_HEAD")
+		cmd.Dir = s.catalogPath
+		cmd.Stderr = os.Stderr
+
+		s.mutex.Lock()
+		err := cmd.Run()
+		s.invalidate()
+		s.mutex.Unlock()
+		if err != nil {
+			return fmt.Errorf("failed to pull catalog updates: %w", err)
+		}
 	}
 
 	s.logger.Info("catalog updated successfully")
@@ -72,102 +143,229 @@ func (s *Store) Update() error {
 
 // GetModules returns all modules from the catalog
 func (s *Store) GetModules() ([]CatalogModule, error) {
-	s.mutex.RLock()
-	defer s.mutex.RUnlock()
-
-	modulesPath := filepath.Join(s.catalogPath, modulesDir)
-	entries, err := os.ReadDir(modulesPath)
-	if err != nil {
-		if os.IsNotExist(err) {
-			// Catalog not initialized yet - return empty list instead of error
-			s.logger.Debug("modules directory not found, returning empty list", "path", modulesPath)
-			return []CatalogModule{}, nil
-		}
-		return nil, fmt.Errorf("failed to read modules directory: %w", err)
-	}
-
-	var modules []CatalogModule
-	for _, entry := range entries {
-		if !entry.IsDir() && filepath.Ext(entry.Name()) == ".yaml" {
-			modulePath := filepath.Join(modulesPath, entry.Name())
-			module, err := s.parseModule(modulePath)
-			if err != nil {
-				s.logger.Warn("failed to parse module", "file", entry.Name(), "error", err)
-				continue
-			}
-			modules = append(modules, module)
-		}
+	if err := s.ensureModules(); err != nil {
+		return nil, err
 	}
 
-	return modules, nil
+	s.mutex.RLock()
+	defer s.mutex.RUnlock()
+	return s.modules, nil
 }
 
 // GetModule returns a specific module by name
 func (s *Store) GetModule(name string) (*CatalogModule, error) {
+	if err := s.ensureModules(); err != nil {
+		return nil, err
+	}
+
 	s.mutex.RLock()
 	defer s.mutex.RUnlock()
 
-	modulePath := filepath.Join(s.catalogPath, modulesDir, name+".yaml")
-	if _, err := os.Stat(modulePath); os.IsNotExist(err) {
-		return nil, fmt.Errorf("module '%s' not found in catalog", name)
+	if err, ok := s.moduleErrs[name]; ok {
+		return nil, fmt.Errorf("failed to parse module '%s': %w", name, err)
 	}
 
-	module, err := s.parseModule(modulePath)
-	if err != nil {
-		return nil, fmt.Errorf("failed to parse module '%s': %w", name, err)
+	idx, ok := s.moduleIndex[name]
+	if !ok {
+		return nil, fmt.Errorf("module '%s' not found in catalog", name)
 	}
 
+	module := s.modules[idx]
 	return &module, nil
 }
 
 // GetBundles returns all bundles from the catalog
 func (s *Store) GetBundles() ([]CatalogBundle, error) {
+	if err := s.ensureBundles(); err != nil {
+		return nil, err
+	}
+
+	s.mutex.RLock()
+	defer s.mutex.RUnlock()
+	return s.bundles, nil
+}
+
+// GetBundle returns a specific bundle by name
+func (s *Store) GetBundle(name string) (*CatalogBundle, error) {
+	if err := s.ensureBundles(); err != nil {
+		return nil, err
+	}
+
 	s.mutex.RLock()
 	defer s.mutex.RUnlock()
 
+	if err, ok := s.bundleErrs[name]; ok {
+		return nil, fmt.Errorf("failed to parse bundle '%s': %w", name, err)
+	}
+
+	idx, ok := s.bundleIndex[name]
+	if !ok {
+		return nil, fmt.Errorf("bundle '%s' not found in catalog", name)
+	}
+
+	bundle := s.bundles[idx]
+	return &bundle, nil
+}
+
+// ensureModules parses the catalog's module YAML files once and caches the
+// result. The cache is dropped whenever Update changes the catalog on disk.
+func (s *Store) ensureModules() error {
+	s.mutex.RLock()
+	loaded := s.modulesLoaded
+	s.mutex.RUnlock()
+	if loaded {
+		return nil
+	}
+
+	s.mutex.Lock()
+	defer s.mutex.Unlock()
+	if s.modulesLoaded {
+		return nil
+	}
+
+	modules, moduleIndex, moduleErrs, err := s.loadModules()
+	if err != nil {
+		return err
+	}
+
+	s.modules, s.moduleIndex, s.moduleErrs = modules, moduleIndex, moduleErrs
+	s.modulesLoaded = true
+	return nil
+}
+
+// ensureBundles is ensureModules for bundles. Kept separate so module
+// lookups (the common path during installs) never parse bundle files.
+func (s *Store) ensureBundles() error {
+	s.mutex.RLock()
+	loaded := s.bundlesLoaded
+	s.mutex.RUnlock()
+	if loaded {
+		return nil
+	}
+
+	s.mutex.Lock()
+	defer s.mutex.Unlock()
+	if s.bundlesLoaded {
+		return nil
+	}
+
+	bundles, bundleIndex, bundleErrs, err := s.loadBundles()
+	if err != nil {
+		return err
+	}
+
+	s.bundles, s.bundleIndex, s.bundleErrs = bundles, bundleIndex, bundleErrs
+	s.bundlesLoaded = true
+	return nil
+}
+
+// invalidate drops the parsed catalog cache (caller must hold the write lock)
+func (s *Store) invalidate() {
+	s.modulesLoaded, s.bundlesLoaded = false, false
+	s.modules, s.moduleIndex, s.moduleErrs = nil, nil, nil
+	s.bundles, s.bundleIndex, s.bundleErrs = nil, nil, nil
+}
+
+// loadModules parses all module YAML files, indexed by file name. Files that
+// fail to parse are returned in errs so lookups can report the parse error.
+func (s *Store) loadModules() ([]CatalogModule, map[string]int, map[string]error, error) {
+	modulesPath := filepath.Join(s.catalogPath, modulesDir)
+	entries, err := os.ReadDir(modulesPath)
+	if err != nil {
+		if os.IsNotExist(err) {
+			// Catalog not initialized yet - return empty list instead of error
+			s.logger.Debug("modules directory not found, returning empty list", "path", modulesPath)
+			return []CatalogModule{}, map[string]int{}, map[string]error{}, nil
+		}
+		return nil, nil, nil, fmt.Errorf("failed to read modules directory: %w", err)
+	}
+
+	names := yamlFileNames(entries)
+	parsed, errs := parseFiles(modulesPath, names, s.parseModule)
+
+	modules := make([]CatalogModule, 0, len(names))
+	index := make(map[string]int, len(names))
+	parseErrs := make(map[string]error)
+	for i, name := range names {
+		if errs[i] != nil {
+			s.logger.Warn("failed to parse module", "file", name, "error", errs[i])
+			parseErrs[strings.TrimSuffix(name, ".yaml")] = errs[i]
+			continue
+		}
+		index[strings.TrimSuffix(name, ".yaml")] = len(modules)
+		modules = append(modules, parsed[i])
+	}
+
+	return modules, index, parseErrs, nil
+}
+
+// loadBundles parses all bundle YAML files, indexed by file name. Files that
+// fail to parse are returned in errs so lookups can report the parse error.
+func (s *Store) loadBundles() ([]CatalogBundle, map[string]int, map[string]error, error) {
 	bundlesPath := filepath.Join(s.catalogPath, bundlesDir)
 	entries, err := os.ReadDir(bundlesPath)
 	if err != nil {
 		if os.IsNotExist(err) {
 			// Catalog not initialized yet - return empty list instead of error
 			s.logger.Debug("bundles directory not found, returning empty list", "path", bundlesPath)
-			return []CatalogBundle{}, nil
+			return []CatalogBundle{}, map[string]int{}, map[string]error{}, nil
 		}
-		return nil, fmt.Errorf("failed to read bundles directory: %w", err)
+		return nil, nil, nil, fmt.Errorf("failed to read bundles directory: %w", err)
 	}
 
-	var bundles []CatalogBundle
-	for _, entry := range entries {
-		if !entry.IsDir() && filepath.Ext(entry.Name()) == ".yaml" {
-			bundlePath := filepath.Join(bundlesPath, entry.Name())
-			bundle, err := s.parseBundle(bundlePath)
-			if err != nil {
-				s.logger.Warn("failed to parse bundle", "file", entry.Name(), "error", err)
-				continue
-			}
-			bundles = append(bundles, bundle)
+	names := yamlFileNames(entries)
+	parsed, errs := parseFiles(bundlesPath, names, s.parseBundle)
+
+	bundles := make([]CatalogBundle, 0, len(names))
+	index := make(map[string]int, len(names))
+	parseErrs := make(map[string]error)
+	for i, name := range names {
+		if errs[i] != nil {
+			s.logger.Warn("failed to parse bundle", "file", name, "error", errs[i])
+			parseErrs[strings.TrimSuffix(name, ".yaml")] = errs[i]
+			continue
 		}
+		index[strings.TrimSuffix(name, ".yaml")] = len(bundles)
+		bundles = append(bundles, parsed[i])
 	}
 
-	return bundles, nil
+	return bundles, index, parseErrs, nil
 }
 
-// GetBundle returns a specific bundle by name
-func (s *Store) GetBundle(name string) (*CatalogBundle, error) {
-	s.mutex.RLock()
-	defer s.mutex.RUnlock()
-
-	bundlePath := filepath.Join(s.catalogPath, bundlesDir, name+".yaml")
-	if _, err := os.Stat(bundlePath); os.IsNotExist(err) {
-		return nil, fmt.Errorf("bundle '%s' not found in catalog", name)
+// yamlFileNames returns the names of the YAML files among directory entries
+func yamlFileNames(entries []os.DirEntry) []string {
+	var names []string
+	for _, entry := range entries {
+		if !entry.IsDir() && filepath.Ext(entry.Name()) == ".yaml" {
+			names = append(names, entry.Name())
+		}
 	}
+	return names
+}
 
-	bundle, err := s.parseBundle(bundlePath)
-	if err != nil {
-		return nil, fmt.Errorf("failed to parse bundle '%s': %w", name, err)
+// parseConcurrency bounds how many catalog files parseFiles parses at once
+const parseConcurrency = 8
+
+// parseFiles parses the named files in dir concurrently. Results and errors
+// are returned in the same order as names.
+func parseFiles[T any](dir string, names []string, parse func(string) (T, error)) ([]T, []error) {
+	results := make([]T, len(names))
+	errs := make([]error, len(names))
+
+	sem := make(chan struct{}, parseConcurrency)
+	var wg sync.WaitGroup
+	for i, name := range names {
+		wg.Add(1)
+		sem <- struct{}{}
+		go func(i int, name string) {
+			defer wg.Done()
+			defer func() { <-sem }()
+			results[i], errs[i] = parse(filepath.Join(dir, name))
+		}(i, name)
 	}
+	wg.Wait()
 
-	return &bundle, nil
+	return results, errs
 }
 
 // GetStats returns statistics about the catalog
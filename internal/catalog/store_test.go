@@ -0,0 +1,81 @@
+package catalog
+
+import (
+	"io"
+	"log/slog"
+	"os"
+	"path/filepath"
+	"strings"
+	"testing"
+)
+
+func newTestStore(t *testing.T, files map[string]string) *Store {
+	t.Helper()
+
+	dir := t.TempDir()
+	for name, content := range files {
+		path := filepath.Join(dir, name)
+		if err := os.MkdirAll(filepath.Dir(path), 0755); err != nil {
+			t.Fatal(err)
+		}
+		if err := os.WriteFile(path, []byte(content), 0644); err != nil {
+			t.Fatal(err)
+		}
+	}
+
+	return &Store{
+		catalogPath: dir,
+		logger:      slog.New(slog.NewTextHandler(io.Discard, nil)),
+	}
+}
+
+func TestGetModule(t *testing.T) {
+	s := newTestStore(t, map[string]string{
+		"modules/ollama.yaml": "name: ollama\nsource: https://example.com/ollama.git\n",
+		"modules/broken.yaml": "name: [unterminated\n",
+	})
+
+	tests := []struct {
+		name    string
+		module  string
+		wantErr string
+	}{
+		{name: "valid module", module: "ollama"},
+		{name: "unparseable module", module: "broken", wantErr: "failed to parse module 'broken'"},
+		{name: "missing module", module: "missing", wantErr: "module 'missing' not found in catalog"},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			module, err := s.GetModule(tt.module)
+			if tt.wantErr != "" {
+				if err == nil || !strings.Contains(err.Error(), tt.wantErr) {
+					t.Fatalf("GetModule(%q) error = %v, want %q", tt.module, err, tt.wantErr)
+				}
+				return
+			}
+			if err != nil {
+				t.Fatalf("GetModule(%q) unexpected error: %v", tt.module, err)
+			}
+			if module.Name != tt.module {
+				t.Errorf("GetModule(%q).Name = %q", tt.module, module.Name)
+			}
+		})
+	}
+}
+
+func TestGetBundle(t *testing.T) {
+	s := newTestStore(t, map[string]string{
+		"bundles/broken.yaml": "name: [unterminated\n",
+	})
+
+	_, err := s.GetBundle("broken")
+	if err == nil || !strings.Contains(err.Error(), "failed to parse bundle 'broken'") {
+		t.Fatalf("GetBundle(broken) error = %v, want parse error", err)
+	}
+
+	_, err = s.GetBundle("missing")
+	if err == nil || !strings.Contains(err.Error(), "bundle 'missing' not found in catalog") {
+		t.Fatalf("GetBundle(missing) error = %v, want not found", err)
+	}
+}
@@ -64,6 +64,11 @@ func GetBootstrapPath(xdsHost string, xdsPort int) (string, error) {
 	// Generate bootstrap config with xDS host and port
 	config := fmt.Sprintf(bootstrapTemplate, xdsHost, xdsPort)
 
+	// Leave an up-to-date config untouched
+	if existing, err := os.ReadFile(bootstrapPath); err == nil && string(existing) == config {
+		return bootstrapPath, nil
+	}
+
 	// Write bootstrap config
 	if err := os.WriteFile(bootstrapPath, []byte(config), 0644); err != nil {
 		return "", fmt.Errorf("failed to write bootstrap config: %w", err)
@@ -8,6 +8,9 @@ import (
 	"os"
 	"strconv"
 
+	zpnetwork "zeropoint-agent/internal/network"
+
+	cerrdefs "github.com/containerd/errdefs"
 	"github.com/moby/moby/api/types/container"
 	"github.com/moby/moby/api/types/network"
 	"github.com/moby/moby/client"
@@ -45,27 +48,9 @@ func (m *Manager) EnsureRunning(ctx context.Context) error {
 	m.logger.Info("ensuring envoy container is running")
 
 	// Check if container exists
-	result, err := m.docker.ContainerList(ctx, client.ContainerListOptions{
-		All: true,
-	})
+	containerID, containerState, err := m.findContainer(ctx)
 	if err != nil {
-		return fmt.Errorf("failed to list containers: %w", err)
-	}
-
-	// Find our container by name
-	var containerID string
-	var containerState string
-	for _, c := range result.Items {
-		for _, name := range c.Names {
-			if name == "/"+containerName || name == containerName {
-				containerID = c.ID
-				containerState = string(c.State)
-				break
-			}
-		}
-		if containerID != "" {
-			break
-		}
+		return err
 	}
 
 	if containerID != "" {
@@ -93,27 +78,9 @@ func (m *Manager) EnsureRunning(ctx context.Context) error {
 func (m *Manager) Stop(ctx context.Context) error {
 	m.logger.Info("stopping envoy container")
 
-	result, err := m.docker.ContainerList(ctx, client.ContainerListOptions{
-		All: true,
-	})
+	containerID, containerState, err := m.findContainer(ctx)
 	if err != nil {
-		return fmt.Errorf("failed to list containers: %w", err)
-	}
-
-	// Find our container
-	var containerID string
-	var containerState string
-	for _, c := range result.Items {
-		for _, name := range c.Names {
-			if name == "/"+containerName || name == containerName {
-				containerID = c.ID
-				containerState = string(c.State)
-				break
-			}
-		}
-		if containerID != "" {
-			break
-		}
+		return err
 	}
 
 	if containerID == "" {
@@ -135,6 +102,21 @@ func (m *Manager) Stop(ctx context.Context) error {
 	return nil
 }
 
+// findContainer returns the ID and state of the envoy container, or an empty
+// ID if it doesn't exist. The container name is known, so it is inspected
+// directly instead of listing every container.
+func (m *Manager) findContainer(ctx context.Context) (string, string, error) {
+	info, err := m.docker.ContainerInspect(ctx, containerName, client.ContainerInspectOptions{})
+	if err != nil {
+		if cerrdefs.IsNotFound(err) {
+			return "", "", nil
+		}
+		return "", "", fmt.Errorf("failed to inspect envoy container: %w", err)
+	}
+
+	return info.Container.ID, string(info.Container.State.Status), nil
+}
+
 func (m *Manager) createAndStart(ctx context.Context) error {
 	m.logger.Info("creating envoy container", "image", m.image)
 
@@ -265,66 +247,14 @@ func getEnvString(key, defaultValue string) string {
 
 // ensureZeropointNetwork connects Envoy to the zeropoint-network
 func (m *Manager) ensureZeropointNetwork(ctx context.Context, containerID string) error {
-	networkName := "zeropoint-network"
-
-	// Create network if it doesn't exist
-	networkList, err := m.docker.NetworkList(ctx, client.NetworkListOptions{})
-	if err != nil {
-		return fmt.Errorf("failed to list networks: %w", err)
-	}
-
-	networkExists := false
-	var networkID string
-	for _, network := range networkList.Items {
-		if network.Name == networkName {
-			networkExists = true
-			networkID = network.ID
-			break
-		}
-	}
-
-	if !networkExists {
-		resp, err := m.docker.NetworkCreate(ctx, networkName, client.NetworkCreateOptions{
-			Driver: "bridge",
-		})
-		if err != nil {
-			return fmt.Errorf("failed to create network: %w", err)
-		}
-		networkID = resp.ID
-		m.logger.Info("created zeropoint-network", "id", networkID)
-	}
-
-	// Connect container to network
-	_, err = m.docker.NetworkConnect(ctx, networkID, client.NetworkConnectOptions{
-		Container: containerID,
-	})
-	if err != nil && !isAlreadyConnectedError(err) {
-		return fmt.Errorf("failed to connect to network: %w", err)
+	if err := zpnetwork.NewManager(m.docker, m.logger).ConnectContainerToNetwork(ctx, containerID, "zeropoint-network"); err != nil {
+		return err
 	}
 
 	m.logger.Info("connected envoy to zeropoint-network")
 	return nil
 }
 
-func isAlreadyConnectedError(err error) bool {
-	if err == nil {
-		return false
-	}
-	errStr := err.Error()
-	return len(errStr) > 0 && (contains(errStr, "already connected") ||
-		contains(errStr, "already exists in network") ||
-		contains(errStr, "already attached"))
-}
-
-func contains(s, substr string) bool {
-	for i := 0; i <= len(s)-len(substr); i++ {
-		if s[i:i+len(substr)] == substr {
-			return true
-		}
-	}
-	return false
-}
-
 // getNetworkGateway inspects a Docker network and returns its gateway IP
 func (m *Manager) getNetworkGateway(ctx context.Context, networkName string) (string, error) {
 	// Create network if it doesn't exist
@@ -27,8 +27,8 @@ type Variable struct {
 	Required    bool // true if no default value
 }
 
-// ParseModuleOutputs parses main.tf and extracts all output blocks
-func ParseModuleOutputs(modulePath string) (map[string]Output, error) {
+// parseMainBody reads and parses the module's main.tf
+func parseMainBody(modulePath string) (*hclsyntax.Body, error) {
 	mainTfPath := filepath.Join(modulePath, "main.tf")
 
 	parser := hclparse.NewParser()
@@ -42,7 +42,40 @@ func ParseModuleOutputs(modulePath string) (map[string]Output, error) {
 	if !ok {
 		return nil, fmt.Errorf("unexpected body type: %T", file.Body)
 	}
+	return body, nil
+}
+
+// ParseModule parses main.tf once and extracts both variable and output blocks
+func ParseModule(modulePath string) (map[string]Variable, map[string]Output, error) {
+	body, err := parseMainBody(modulePath)
+	if err != nil {
+		return nil, nil, err
+	}
+
+	inputs, err := inputsFromBody(body)
+	if err != nil {
+		return nil, nil, err
+	}
+
+	outputs, err := outputsFromBody(body)
+	if err != nil {
+		return nil, nil, err
+	}
+
+	return inputs, outputs, nil
+}
+
+// ParseModuleOutputs parses main.tf and extracts all output blocks
+func ParseModuleOutputs(modulePath string) (map[string]Output, error) {
+	body, err := parseMainBody(modulePath)
+	if err != nil {
+		return nil, err
+	}
+	return outputsFromBody(body)
+}
 
+// outputsFromBody extracts all output blocks from a parsed body
+func outputsFromBody(body *hclsyntax.Body) (map[string]Output, error) {
 	outputs := make(map[string]Output)
 
 	// Iterate through top-level blocks to find outputs
@@ -93,19 +126,15 @@ func ParseModuleOutputs(modulePath string) (map[string]Output, error) {
 
 // ParseModuleInputs parses main.tf and extracts all variable blocks
 func ParseModuleInputs(modulePath string) (map[string]Variable, error) {
-	mainTfPath := filepath.Join(modulePath, "main.tf")
-
-	parser := hclparse.NewParser()
-	file, diags := parser.ParseHCLFile(mainTfPath)
-	if diags.HasErrors() {
-		return nil, fmt.Errorf("failed to parse HCL: %s", diags.Error())
-	}
-
-	body, ok := file.Body.(*hclsyntax.Body)
-	if !ok {
-		return nil, fmt.Errorf("unexpected body type: %T", file.Body)
+	body, err := parseMainBody(modulePath)
+	if err != nil {
+		return nil, err
 	}
+	return inputsFromBody(body)
+}
 
+// inputsFromBody extracts all variable blocks from a parsed body
+func inputsFromBody(body *hclsyntax.Body) (map[string]Variable, error) {
 	variables := make(map[string]Variable)
 
 	for _, block := range body.Blocks {
@@ -188,19 +188,32 @@ func (s *Service) Register(ctx context.Context, port int) error {
 	return nil
 }
 
-// isDockerNetwork checks if an IP is in common Docker network ranges
-func isDockerNetwork(ip net.IP) bool {
-	// Docker default bridge: 172.17.0.0/16
-	// Docker custom bridges: 172.16.0.0/12 (172.16.0.0 - 172.31.255.255)
-	// Docker compose: 172.x.x.x ranges
-	// Common internal ranges: 10.0.0.0/8
-	dockerRanges := []string{
-		"172.16.0.0/12", // Docker user-defined networks
-		"10.0.0.0/8",    // Common internal networks
+// dockerNetworks are the common Docker network ranges, parsed once.
+// Docker default bridge: 172.17.0.0/16
+// Docker custom bridges: 172.16.0.0/12 (172.16.0.0 - 172.31.255.255)
+// Docker compose: 172.x.x.x ranges
+// Common internal ranges: 10.0.0.0/8
+var dockerNetworks = mustParseCIDRs(
+	"172.16.0.0/12", // Docker user-defined networks
+	"10.0.0.0/8",    // Common internal networks
+)
+
+// mustParseCIDRs parses a fixed list of CIDRs, panicking on invalid input
+func mustParseCIDRs(cidrs ...string) []*net.IPNet {
+	networks := make([]*net.IPNet, 0, len(cidrs))
+	for _, cidr := range cidrs {
+		_, network, err := net.ParseCIDR(cidr)
+		if err != nil {
+			panic(err)
+		}
+		networks = append(networks, network)
 	}
+	return networks
+}
 
-	for _, cidr := range dockerRanges {
-		_, network, _ := net.ParseCIDR(cidr)
+// isDockerNetwork checks if an IP is in common Docker network ranges
+func isDockerNetwork(ip net.IP) bool {
+	for _, network := range dockerNetworks {
 		if network.Contains(ip) {
 			return true
 		}
@@ -247,20 +260,7 @@ func (s *Service) RegisterExposure(hostname string, port int) error {
 	}
 
 	// Get IP addresses from interfaces
-	var ips []string
-	for _, iface := range ifaces {
-		addrs, err := iface.Addrs()
-		if err != nil {
-			continue
-		}
-		for _, addr := range addrs {
-			if ipnet, ok := addr.(*net.IPNet); ok {
-				if ipv4 := ipnet.IP.To4(); ipv4 != nil {
-					ips = append(ips, ipv4.String())
-				}
-			}
-		}
-	}
+	ips := s.interfaceIPv4s(ifaces)
 
 	if len(ips) == 0 {
 		return fmt.Errorf("no IP addresses found for mDNS exposure registration")
@@ -431,28 +431,14 @@ func (s *Service) refreshAllExposures() {
 
 	s.logger.Debug("refreshing mDNS for exposures", "count", len(s.exposures))
 
-	for hostname, oldServer := range s.exposures {
-		// Get IP addresses from interfaces
-		var ips []string
-		for _, iface := range s.ifaces {
-			addrs, err := iface.Addrs()
-			if err != nil {
-				s.logger.Debug("failed to get addresses from interface", "interface", iface.Name, "error", err)
-				continue
-			}
-			for _, addr := range addrs {
-				if ipnet, ok := addr.(*net.IPNet); ok {
-					if ipv4 := ipnet.IP.To4(); ipv4 != nil {
-						ips = append(ips, ipv4.String())
-					}
-				}
-			}
-		}
+	// Every exposure advertises the same interface addresses; query them once
+	ips := s.interfaceIPv4s(s.ifaces)
+	if len(ips) == 0 {
+		s.logger.Warn("no IPs found for exposure refresh", "count", len(s.exposures))
+		return
+	}
 
-		if len(ips) == 0 {
-			s.logger.Warn("no IPs found for exposure refresh", "hostname", hostname)
-			continue
-		}
+	for hostname, oldServer := range s.exposures {
 
 		// Convert dots to dashes for instance name
 		instanceName := strings.TrimSuffix(hostname, ".local")
@@ -493,6 +479,26 @@ func (s *Service) refreshAllExposures() {
 	}
 }
 
+// interfaceIPv4s returns the IPv4 addresses assigned to the given interfaces
+func (s *Service) interfaceIPv4s(ifaces []net.Interface) []string {
+	var ips []string
+	for _, iface := range ifaces {
+		addrs, err := iface.Addrs()
+		if err != nil {
+			s.logger.Debug("failed to get addresses from interface", "interface", iface.Name, "error", err)
+			continue
+		}
+		for _, addr := range addrs {
+			if ipnet, ok := addr.(*net.IPNet); ok {
+				if ipv4 := ipnet.IP.To4(); ipv4 != nil {
+					ips = append(ips, ipv4.String())
+				}
+			}
+		}
+	}
+	return ips
+}
+
 // reregister attempts to re-register the mDNS service
 func (s *Service) reregister() error {
 	if s.server != nil {
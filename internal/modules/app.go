@@ -3,6 +3,9 @@ package modules
 import (
 	"context"
 	"fmt"
+	"strings"
+	"sync"
+	"time"
 
 	"github.com/moby/moby/client"
 )
@@ -64,50 +67,112 @@ const (
 	StateUnknown = "unknown"
 )
 
-// GetContainerStatus queries Docker to get the container's runtime state
-func (m *Module) GetContainerStatus(ctx context.Context, docker *client.Client) error {
-	containerName := fmt.Sprintf("%s-main", m.ID)
+// containerRef is the part of a container listing needed to resolve module state
+type containerRef struct {
+	ID    string
+	State string
+}
+
+// ContainerIndex maps container names (without the leading slash) to their listing entry
+type ContainerIndex map[string]containerRef
+
+// containerIndexTTL bounds how long a container listing is reused. Module and
+// exposure listings are polled by the UI; a short TTL collapses bursts of
+// requests into one Docker call without noticeably delaying state changes.
+const containerIndexTTL = time.Second
+
+var containerIndexCache struct {
+	mu       sync.Mutex
+	index    ContainerIndex
+	listedAt time.Time
+}
+
+// ListContainers lists all containers once so the status of many modules can be
+// resolved without a Docker round-trip per module. Results are reused for
+// containerIndexTTL; the returned index must not be modified.
+func ListContainers(ctx context.Context, docker *client.Client) (ContainerIndex, error) {
+	containerIndexCache.mu.Lock()
+	defer containerIndexCache.mu.Unlock()
+
+	if containerIndexCache.index != nil && time.Since(containerIndexCache.listedAt) < containerIndexTTL {
+		return containerIndexCache.index, nil
+	}
+
+	index, err := listContainers(ctx, docker)
+	if err != nil {
+		return nil, err
+	}
+	containerIndexCache.index = index
+	containerIndexCache.listedAt = time.Now()
+	return index, nil
+}
+
+// InvalidateContainers drops the cached container listing so the next
+// ListContainers call queries Docker
+func InvalidateContainers() {
+	containerIndexCache.mu.Lock()
+	containerIndexCache.index = nil
+	containerIndexCache.mu.Unlock()
+}
 
+// listContainers queries Docker for all containers (uncached)
+func listContainers(ctx context.Context, docker *client.Client) (ContainerIndex, error) {
 	containers, err := docker.ContainerList(ctx, client.ContainerListOptions{All: true})
 	if err != nil {
-		return err
+		return nil, err
 	}
 
+	index := make(ContainerIndex, len(containers.Items))
 	for _, c := range containers.Items {
 		for _, name := range c.Names {
-			if name == "/"+containerName || name == containerName {
-				m.ContainerID = c.ID[:12]
-				m.ContainerName = containerName
-				m.State = string(c.State)
-
-				// Get IP address and GPU info if running
-				if c.State == "running" {
-					inspect, err := docker.ContainerInspect(ctx, c.ID, client.ContainerInspectOptions{})
-					if err == nil {
-						for _, network := range inspect.Container.NetworkSettings.Networks {
-							if network.IPAddress.IsValid() {
-								m.IPAddress = network.IPAddress.String()
-								break
-							}
-						}
-
-						// Check if container is using NVIDIA GPU
-						if inspect.Container.HostConfig.Runtime == "nvidia" {
-							m.GPUVendor = "nvidia"
-						}
-
-						// Check if container has GPU devices allocated
-						if len(inspect.Container.HostConfig.DeviceRequests) > 0 {
-							m.UsingGPU = true
-						}
-					}
+			index[strings.TrimPrefix(name, "/")] = containerRef{ID: c.ID, State: string(c.State)}
+		}
+	}
+	return index, nil
+}
+
+// State returns the listed state of the named container, or "" if it does not exist
+func (idx ContainerIndex) State(name string) string {
+	return idx[name].State
+}
+
+// SetContainerStatus resolves the container's runtime state from a prebuilt
+// container index. Only running containers are inspected.
+func (m *Module) SetContainerStatus(ctx context.Context, docker *client.Client, index ContainerIndex) error {
+	containerName := fmt.Sprintf("%s-main", m.ID)
+
+	c, ok := index[containerName]
+	if !ok {
+		// Container not found
+		m.State = StateUnknown
+		return nil
+	}
+
+	m.ContainerID = c.ID[:12]
+	m.ContainerName = containerName
+	m.State = c.State
+
+	// Get IP address and GPU info if running
+	if c.State == "running" {
+		inspect, err := docker.ContainerInspect(ctx, c.ID, client.ContainerInspectOptions{})
+		if err == nil {
+			for _, network := range inspect.Container.NetworkSettings.Networks {
+				if network.IPAddress.IsValid() {
+					m.IPAddress = network.IPAddress.String()
+					break
 				}
-				return nil
+			}
+
+			// Check if container is using NVIDIA GPU
+			if inspect.Container.HostConfig.Runtime == "nvidia" {
+				m.GPUVendor = "nvidia"
+			}
+
+			// Check if container has GPU devices allocated
+			if len(inspect.Container.HostConfig.DeviceRequests) > 0 {
+				m.UsingGPU = true
 			}
 		}
 	}
-
-	// Container not found
-	m.State = StateUnknown
 	return nil
 }
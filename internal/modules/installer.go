@@ -64,6 +64,7 @@ type InstallRequest struct {
 func (i *Installer) Install(req InstallRequest, progress ProgressCallback) error {
 	logger := i.logger.With("module_id", req.ModuleID)
 	logger.Info("starting installation")
+	defer InvalidateContainers()
 
 	if progress == nil {
 		progress = func(ProgressUpdate) {} // No-op if not provided
@@ -261,20 +262,20 @@ func (i *Installer) Install(req InstallRequest, progress ProgressCallback) error
 	return nil
 }
 
+// commitSHAPattern matches a full 40-character commit SHA
+var commitSHAPattern = regexp.MustCompile("^[a-fA-F0-9]{40}$")
+
 // parseGitURL splits a git URL like "https://github.com/org/repo.git@e155f1b8f60354dcfde90693336865247558242b" into URL and ref
 // Returns error if ref is not a full 40-character commit SHA (no symbolic refs allowed)
 func parseGitURL(source string) (gitURL, ref string, err error) {
-	parts := strings.Split(source, "@")
-	gitURL = parts[0]
-
-	if len(parts) <= 1 {
+	at := strings.LastIndex(source, "@")
+	if at < 0 {
 		return "", "", fmt.Errorf("git URL must include commit SHA after '@' (got %s) - symbolic refs like HEAD, branches, and tags are not allowed for security and reproducibility", source)
 	}
 
-	ref = parts[1]
+	gitURL, ref = source[:at], source[at+1:]
 
 	// Validate that ref is a full 40-character commit SHA
-	commitSHAPattern := regexp.MustCompile("^[a-fA-F0-9]{40}$")
 	if !commitSHAPattern.MatchString(ref) {
 		return "", "", fmt.Errorf("ref must be a full 40-character commit SHA (got %s) - symbolic refs like branches, tags, and HEAD are not allowed for security and reproducibility", ref)
 	}
@@ -284,11 +285,13 @@ func parseGitURL(source string) (gitURL, ref string, err error) {
 
 // cloneFromGit clones a git repository to a temporary directory
 func (i *Installer) cloneFromGit(gitURL, ref, targetPath string) error {
-	// Clone the repository directly to target location
-	cloneArgs := []string{"clone", gitURL, targetPath}
+	// Clone the repository directly to target location. Skip the initial
+	// checkout: the default branch's tree would be written only to be
+	// replaced by the pinned commit below.
+	cloneArgs := []string{"clone", "--no-checkout", gitURL, targetPath}
 
+	// Only stderr is forwarded (for failures); stdout is not used and is discarded
 	cloneCmd := exec.Command("git", cloneArgs...)
-	cloneCmd.Stdout = os.Stdout
 	cloneCmd.Stderr = os.Stderr
 
 	if err := cloneCmd.Run(); err != nil {
@@ -299,7 +302,6 @@ func (i *Installer) cloneFromGit(gitURL, ref, targetPath string) error {
 	checkoutArgs := []string{"checkout", ref}
 	checkoutCmd := exec.Command("git", checkoutArgs...)
 	checkoutCmd.Dir = targetPath
-	checkoutCmd.Stdout = os.Stdout
 	checkoutCmd.Stderr = os.Stderr
 
 	if err := checkoutCmd.Run(); err != nil {
@@ -13,12 +13,7 @@ import (
 // LoadContainers reads all {container}_ports and {container}_mounts outputs from a Terraform module
 // and returns a map of container configurations
 func LoadContainers(modulePath string, moduleID string) (map[string]Container, error) {
-	executor, err := terraform.NewExecutor(modulePath)
-	if err != nil {
-		return nil, fmt.Errorf("failed to create terraform executor: %w", err)
-	}
-
-	outputs, err := executor.Output()
+	outputs, err := terraform.ReadOutputs(modulePath)
 	if err != nil {
 		return nil, fmt.Errorf("failed to read terraform outputs: %w", err)
 	}
@@ -38,6 +38,7 @@ type UninstallRequest struct {
 func (u *Uninstaller) Uninstall(req UninstallRequest, progress ProgressCallback) error {
 	logger := u.logger.With("module_id", req.ModuleID)
 	logger.Info("starting uninstallation")
+	defer InvalidateContainers()
 
 	if progress == nil {
 		progress = func(ProgressUpdate) {} // No-op if not provided
@@ -60,10 +61,16 @@ func (u *Uninstaller) Uninstall(req UninstallRequest, progress ProgressCallback)
 		return fmt.Errorf("failed to create terraform executor: %w", err)
 	}
 
-	// Need to init first
-	if err := executor.Init(); err != nil {
-		logger.Error("terraform init failed", "error", err)
-		return fmt.Errorf("terraform init failed: %w", err)
+	// Install already initialized the module (link reconfiguration relies on
+	// this too); only init up front if the working directory is missing, e.g.
+	// after an install that failed before init
+	initialized := false
+	if _, err := os.Stat(filepath.Join(modulePath, ".terraform")); err != nil {
+		if err := executor.Init(); err != nil {
+			logger.Error("terraform init failed", "error", err)
+			return fmt.Errorf("terraform init failed: %w", err)
+		}
+		initialized = true
 	}
 
 	// Destroy with auto-approve
@@ -82,7 +89,18 @@ func (u *Uninstaller) Uninstall(req UninstallRequest, progress ProgressCallback)
 		"zp_module_storage": absModuleStoragePath,
 	}
 
-	if err := executor.Destroy(variables); err != nil {
+	err = executor.Destroy(variables)
+	if err != nil && !initialized {
+		// The working directory may be incomplete (e.g. an install interrupted
+		// during a provider download); init and retry once
+		logger.Warn("terraform destroy failed, re-running init and retrying", "error", err)
+		if initErr := executor.Init(); initErr != nil {
+			logger.Error("terraform init failed", "error", initErr)
+			return fmt.Errorf("terraform init failed: %w", initErr)
+		}
+		err = executor.Destroy(variables)
+	}
+	if err != nil {
 		logger.Error("terraform destroy failed", "error", err)
 		return fmt.Errorf("terraform destroy failed: %w", err)
 	}
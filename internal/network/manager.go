@@ -4,6 +4,7 @@ import (
 	"context"
 	"fmt"
 	"log/slog"
+	"strings"
 
 	"github.com/moby/moby/client"
 )
@@ -75,16 +76,7 @@ func isAlreadyConnectedError(err error) bool {
 		return false
 	}
 	errStr := err.Error()
-	return containsString(errStr, "already connected") ||
-		containsString(errStr, "already exists in network") ||
-		containsString(errStr, "already attached")
-}
-
-func containsString(s, substr string) bool {
-	for i := 0; i <= len(s)-len(substr); i++ {
-		if s[i:i+len(substr)] == substr {
-			return true
-		}
-	}
-	return false
+	return strings.Contains(errStr, "already connected") ||
+		strings.Contains(errStr, "already exists in network") ||
+		strings.Contains(errStr, "already attached")
 }
@@ -382,11 +382,12 @@ func (e *JobExecutor) executeBundleInstall(ctx context.Context, jobID string, ma
 
 	// Update component statuses based on their job results
 	if e.bundleStore != nil {
-		// Check each dependency job to see if it succeeded or failed
+		// Check each dependency job to see if it succeeded or failed.
+		// Read them all in one pass; only command and status are needed.
+		depJobs := manager.GetJobs(job.DependsOn)
 		for _, depJobID := range job.DependsOn {
-			depJob, err := manager.Get(depJobID)
-			if err != nil {
-				e.logger.Warn("failed to get dependency job", "dep_job_id", depJobID, "error", err)
+			depJob, ok := depJobs[depJobID]
+			if !ok {
 				continue
 			}
 
@@ -456,11 +457,12 @@ func (e *JobExecutor) executeBundleUninstall(ctx context.Context, jobID string,
 
 	// Update component statuses based on their job results
 	if e.bundleStore != nil {
-		// Check each dependency job to see if it succeeded or failed
+		// Check each dependency job to see if it succeeded or failed.
+		// Read them all in one pass; only command and status are needed.
+		depJobs := manager.GetJobs(job.DependsOn)
 		for _, depJobID := range job.DependsOn {
-			depJob, err := manager.Get(depJobID)
-			if err != nil {
-				e.logger.Warn("failed to get dependency job", "dep_job_id", depJobID, "error", err)
+			depJob, ok := depJobs[depJobID]
+			if !ok {
 				continue
 			}
 
@@ -0,0 +1,182 @@
+package queue
+
+import (
+	"context"
+	"io"
+	"log/slog"
+	"reflect"
+	"testing"
+)
+
+type createdExposure struct {
+	exposureID, moduleID, protocol, hostname string
+	containerPort                            uint32
+	tags                                     []string
+}
+
+type fakeExposureHandler struct {
+	created []createdExposure
+}
+
+func (f *fakeExposureHandler) CreateExposure(ctx context.Context, exposureID, moduleID, protocol, hostname string, containerPort uint32, tags []string) error {
+	f.created = append(f.created, createdExposure{exposureID, moduleID, protocol, hostname, containerPort, tags})
+	return nil
+}
+
+func (f *fakeExposureHandler) DeleteExposure(ctx context.Context, exposureID string) error {
+	return nil
+}
+
+type createdLink struct {
+	linkID  string
+	modules map[string]map[string]interface{}
+	tags    []string
+}
+
+type fakeLinkHandler struct {
+	created []createdLink
+}
+
+func (f *fakeLinkHandler) CreateLink(ctx context.Context, linkID string, modules map[string]map[string]interface{}, tags []string) error {
+	f.created = append(f.created, createdLink{linkID, modules, tags})
+	return nil
+}
+
+func (f *fakeLinkHandler) DeleteLink(ctx context.Context, id string) error {
+	return nil
+}
+
+func newTestManager(t *testing.T, jobsDir string) *Manager {
+	t.Helper()
+	m, err := NewManager(jobsDir, slog.New(slog.NewTextHandler(io.Discard, nil)))
+	if err != nil {
+		t.Fatalf("NewManager: %v", err)
+	}
+	return m
+}
+
+// TestExecuteEnqueuedJobs runs jobs enqueued with the Go types the HTTP
+// handlers use through the executor, both from the live manager and from a
+// manager that reloaded them from disk
+func TestExecuteEnqueuedJobs(t *testing.T) {
+	jobsDir := t.TempDir()
+	m := newTestManager(t, jobsDir)
+
+	linkModules := map[string]map[string]interface{}{
+		"openwebui": {"ollama_url": "${ollama.url}"},
+		"ollama":    {},
+	}
+
+	exposureJobID, err := m.Enqueue(Command{
+		Type: CmdCreateExposure,
+		Args: map[string]interface{}{
+			"exposure_id":    "openwebui",
+			"module_id":      "openwebui",
+			"protocol":       "http",
+			"hostname":       "chat",
+			"container_port": uint32(8080),
+			"tags":           []string{"local-ai-chat"},
+		},
+	}, nil)
+	if err != nil {
+		t.Fatalf("Enqueue create_exposure: %v", err)
+	}
+
+	linkJobID, err := m.Enqueue(Command{
+		Type: CmdCreateLink,
+		Args: map[string]interface{}{
+			"link_id": "chat",
+			"modules": linkModules,
+			"tags":    []string{"local-ai-chat"},
+		},
+	}, nil)
+	if err != nil {
+		t.Fatalf("Enqueue create_link: %v", err)
+	}
+
+	wantExposure := createdExposure{"openwebui", "openwebui", "http", "chat", 8080, []string{"local-ai-chat"}}
+	wantLink := createdLink{"chat", linkModules, []string{"local-ai-chat"}}
+
+	managers := []struct {
+		name    string
+		manager *Manager
+	}{
+		{name: "cached", manager: m},
+		{name: "reloaded", manager: newTestManager(t, jobsDir)},
+	}
+
+	for _, tt := range managers {
+		t.Run(tt.name, func(t *testing.T) {
+			exposures := &fakeExposureHandler{}
+			links := &fakeLinkHandler{}
+			executor := NewJobExecutor(nil, nil, exposures, links, nil, nil, slog.New(slog.NewTextHandler(io.Discard, nil)))
+
+			jobs, _, err := tt.manager.GetQueued()
+			if err != nil {
+				t.Fatalf("GetQueued: %v", err)
+			}
+			if len(jobs) != 2 {
+				t.Fatalf("got %d queued jobs, want 2", len(jobs))
+			}
+
+			for _, job := range jobs {
+				if job.ID != exposureJobID && job.ID != linkJobID {
+					t.Fatalf("unexpected job %s", job.ID)
+				}
+				if _, err := executor.ExecuteWithJob(context.Background(), job.ID, tt.manager, job.Command); err != nil {
+					t.Fatalf("execute %s: %v", job.Command.Type, err)
+				}
+			}
+
+			if len(exposures.created) != 1 || !reflect.DeepEqual(exposures.created[0], wantExposure) {
+				t.Errorf("created exposures = %+v, want %+v", exposures.created, wantExposure)
+			}
+			if len(links.created) != 1 || !reflect.DeepEqual(links.created[0], wantLink) {
+				t.Errorf("created links = %+v, want %+v", links.created, wantLink)
+			}
+		})
+	}
+}
+
+// TestGetJobReturnsIndependentCopy checks that modifying a returned job does
+// not change the cached metadata
+func TestGetJobReturnsIndependentCopy(t *testing.T) {
+	m := newTestManager(t, t.TempDir())
+
+	jobID, err := m.Enqueue(Command{
+		Type: CmdCreateLink,
+		Args: map[string]interface{}{
+			"link_id": "chat",
+			"modules": map[string]map[string]interface{}{"ollama": {"port": 11434}},
+		},
+	}, nil)
+	if err != nil {
+		t.Fatalf("Enqueue: %v", err)
+	}
+
+	m.mu.RLock()
+	job, err := m.getJob(jobID)
+	m.mu.RUnlock()
+	if err != nil {
+		t.Fatalf("getJob: %v", err)
+	}
+	job.Command.Args["link_id"] = "changed"
+	job.Command.Args["modules"].(map[string]interface{})["ollama"].(map[string]interface{})["port"] = 0
+	job.DependsOn = append(job.DependsOn, "other")
+
+	m.mu.RLock()
+	job, err = m.getJob(jobID)
+	m.mu.RUnlock()
+	if err != nil {
+		t.Fatalf("getJob: %v", err)
+	}
+	if job.Command.Args["link_id"] != "chat" {
+		t.Errorf("link_id = %v, want chat", job.Command.Args["link_id"])
+	}
+	if port := job.Command.Args["modules"].(map[string]interface{})["ollama"].(map[string]interface{})["port"]; port != float64(11434) {
+		t.Errorf("ollama port = %v, want 11434", port)
+	}
+	if len(job.DependsOn) != 0 {
+		t.Errorf("DependsOn = %v, want none", job.DependsOn)
+	}
+}
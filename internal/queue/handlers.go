@@ -1,10 +1,12 @@
 package queue
 
 import (
+	"bytes"
 	"encoding/json"
 	"log/slog"
 	"net/http"
 	"reflect"
+	"strconv"
 	"strings"
 
 	"zeropoint-agent/internal/catalog"
@@ -461,17 +463,28 @@ func (h *Handlers) ListJobs(w http.ResponseWriter, r *http.Request) {
 	// Filter by status if provided
 	statusFilter := r.URL.Query().Get("status")
 	if statusFilter != "" && statusFilter != "all" {
-		filteredJobs := make([]JobResponse, 0)
+		statuses := parseStatusFilter(statusFilter)
+		filteredJobs := jobs[:0]
 		for _, job := range jobs {
-			if matchesStatusFilterResponse(job, statusFilter) {
+			if statuses[job.Status] {
 				filteredJobs = append(filteredJobs, job)
 			}
 		}
 		jobs = filteredJobs
 	}
 
+	// Encode the whole response before writing so an encoding failure can
+	// still be reported as a 500 rather than a truncated 200 body
+	var buf bytes.Buffer
+	if err := json.NewEncoder(&buf).Encode(ListJobsResponse{Jobs: jobs}); err != nil {
+		h.logger.Error("failed to encode jobs", "error", err)
+		http.Error(w, "failed to encode response", http.StatusInternalServerError)
+		return
+	}
+
 	w.Header().Set("Content-Type", "application/json")
-	json.NewEncoder(w).Encode(ListJobsResponse{Jobs: jobs})
+	w.Header().Set("Content-Length", strconv.Itoa(buf.Len()))
+	w.Write(buf.Bytes())
 }
 
 // DeleteJobs handles DELETE /jobs (deletes jobs based on status filter)
@@ -518,9 +531,10 @@ func (h *Handlers) DeleteJobs(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
+	deleteStatuses := parseStatusFilter(statusFilter)
 	deletedCount := 0
 	for _, job := range jobs {
-		if matchesStatusFilterResponse(job, statusFilter) {
+		if deleteStatuses[job.Status] {
 			if err := h.manager.Delete(job.ID); err != nil {
 				h.logger.Warn("failed to delete job", "job_id", job.ID, "error", err)
 			} else {
@@ -535,32 +549,25 @@ func (h *Handlers) DeleteJobs(w http.ResponseWriter, r *http.Request) {
 	})
 }
 
-// matchesStatusFilterResponse checks if a job response matches one of the provided status filters
-// statusFilter can be comma-separated values like "completed,failed,cancelled"
-func matchesStatusFilterResponse(job JobResponse, statusFilter string) bool {
-	statuses := strings.Split(statusFilter, ",")
-	for _, status := range statuses {
-		status = strings.TrimSpace(status)
-		switch status {
+// parseStatusFilter resolves a comma-separated status filter like
+// "completed,failed,cancelled" into the set of job statuses it matches, so
+// callers parse the filter once instead of once per job
+func parseStatusFilter(statusFilter string) map[JobStatus]bool {
+	statuses := make(map[JobStatus]bool)
+	for _, status := range strings.Split(statusFilter, ",") {
+		switch strings.TrimSpace(status) {
 		case "active":
-			if job.Status == StatusQueued || job.Status == StatusRunning {
-				return true
-			}
+			statuses[StatusQueued] = true
+			statuses[StatusRunning] = true
 		case "completed":
-			if job.Status == StatusCompleted {
-				return true
-			}
+			statuses[StatusCompleted] = true
 		case "failed":
-			if job.Status == StatusFailed {
-				return true
-			}
+			statuses[StatusFailed] = true
 		case "cancelled":
-			if job.Status == StatusCancelled {
-				return true
-			}
+			statuses[StatusCancelled] = true
 		}
 	}
-	return false
+	return statuses
 }
 
 // CancelJob handles DELETE /jobs/{id}
@@ -714,31 +721,19 @@ func (h *Handlers) EnqueueBundleInstall(w http.ResponseWriter, r *http.Request)
 	if h.bundleStore != nil {
 		// Type assert to get the actual BundleStore methods
 		if bs, ok := h.bundleStore.(interface {
-			CreateBundle(bundleID, bundleName, jobID string) interface{}
-			AddModuleComponent(bundleID, moduleID string, status, errMsg string) error
-			AddLinkComponent(bundleID, linkID string, status, errMsg string) error
-			AddExposureComponent(bundleID, exposureID string, status, errMsg string) error
+			CreateBundleWithComponents(bundleID, bundleName, jobID string, moduleIDs, linkIDs, exposureIDs []string) interface{}
 		}); ok {
-			bs.CreateBundle(req.BundleName, bundle.Name, jobID)
-
-			// Add all modules as components
-			for _, moduleName := range bundle.Modules {
-				_ = bs.AddModuleComponent(req.BundleName, moduleName, "queued", "")
+			// Collect all components so the record is written once
+			linkIDs := make([]string, 0, len(bundle.Links))
+			for linkID := range bundle.Links {
+				linkIDs = append(linkIDs, linkID)
 			}
-
-			// Add all links as components
-			if bundle.Links != nil {
-				for linkID := range bundle.Links {
-					_ = bs.AddLinkComponent(req.BundleName, linkID, "queued", "")
-				}
+			exposureIDs := make([]string, 0, len(bundle.Exposures))
+			for exposureID := range bundle.Exposures {
+				exposureIDs = append(exposureIDs, exposureID)
 			}
 
-			// Add all exposures as components
-			if bundle.Exposures != nil {
-				for exposureID := range bundle.Exposures {
-					_ = bs.AddExposureComponent(req.BundleName, exposureID, "queued", "")
-				}
-			}
+			bs.CreateBundleWithComponents(req.BundleName, bundle.Name, jobID, bundle.Modules, linkIDs, exposureIDs)
 		}
 	}
 
@@ -0,0 +1,31 @@
+package queue
+
+import (
+	"reflect"
+	"testing"
+)
+
+func TestParseStatusFilter(t *testing.T) {
+	tests := []struct {
+		filter string
+		want   map[JobStatus]bool
+	}{
+		{filter: "active", want: map[JobStatus]bool{StatusQueued: true, StatusRunning: true}},
+		{filter: "completed", want: map[JobStatus]bool{StatusCompleted: true}},
+		{filter: "completed,failed,cancelled", want: map[JobStatus]bool{StatusCompleted: true, StatusFailed: true, StatusCancelled: true}},
+		{filter: " failed , active ", want: map[JobStatus]bool{StatusFailed: true, StatusQueued: true, StatusRunning: true}},
+		{filter: "completed,completed", want: map[JobStatus]bool{StatusCompleted: true}},
+		// Only the groupings above are recognised; raw queued/running are not
+		{filter: "queued,running", want: map[JobStatus]bool{}},
+		{filter: "bogus", want: map[JobStatus]bool{}},
+		{filter: "", want: map[JobStatus]bool{}},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.filter, func(t *testing.T) {
+			if got := parseStatusFilter(tt.filter); !reflect.DeepEqual(got, tt.want) {
+				t.Errorf("parseStatusFilter(%q) = %v, want %v", tt.filter, got, tt.want)
+			}
+		})
+	}
+}
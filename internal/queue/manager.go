@@ -9,6 +9,7 @@ import (
 	"path/filepath"
 	"sort"
 	"sync"
+	"sync/atomic"
 	"time"
 
 	"github.com/google/uuid"
@@ -16,9 +17,13 @@ import (
 
 // Manager handles job enqueueing, tracking, and execution
 type Manager struct {
-	jobsDir string
-	mu      sync.RWMutex
-	logger  *slog.Logger
+	jobsDir    string
+	mu         sync.RWMutex
+	jobs       map[string]*Job    // metadata of every job on disk, kept in sync by writeJobMetadata and Delete
+	events     map[string][]Event // event logs of queued and running jobs, extended by appendEvent
+	eventsMu   sync.Mutex         // guards events, which readers fill under m.mu.RLock
+	logger     *slog.Logger
+	generation atomic.Uint64 // bumped whenever job metadata is written or a job is deleted
 }
 
 // NewManager creates a new job manager
@@ -28,10 +33,51 @@ func NewManager(jobsDir string, logger *slog.Logger) (*Manager, error) {
 		return nil, fmt.Errorf("failed to create jobs directory: %w", err)
 	}
 
-	return &Manager{
+	m := &Manager{
 		jobsDir: jobsDir,
+		jobs:    make(map[string]*Job),
+		events:  make(map[string][]Event),
 		logger:  logger,
-	}, nil
+	}
+
+	// Job metadata is read from disk once; afterwards this manager is its
+	// only writer, so reads are served from memory
+	if err := m.loadJobs(); err != nil {
+		return nil, err
+	}
+
+	return m, nil
+}
+
+// loadJobs reads every job's metadata from the jobs directory into memory
+func (m *Manager) loadJobs() error {
+	entries, err := os.ReadDir(m.jobsDir)
+	if err != nil {
+		return fmt.Errorf("failed to read jobs directory: %w", err)
+	}
+
+	for _, entry := range entries {
+		if !entry.IsDir() {
+			continue
+		}
+
+		jobID := entry.Name()
+		job, err := m.readJobFile(jobID)
+		if err != nil {
+			m.logger.Error("failed to read job", "job_id", jobID, "error", err)
+			continue
+		}
+		m.jobs[jobID] = job
+	}
+
+	return nil
+}
+
+// Generation returns a counter that changes whenever any job's metadata is
+// written or a job is deleted. Callers can compare it between polls to skip
+// re-examining the queue when nothing has changed.
+func (m *Manager) Generation() uint64 {
+	return m.generation.Load()
 }
 
 // jobDir returns the directory for a specific job
@@ -184,8 +230,107 @@ func (m *Manager) Get(jobID string) (*JobResponse, error) {
 	}, nil
 }
 
-// getJob is an internal method that reads job metadata without locking (caller must lock)
+// GetJobs reads the metadata of several jobs under a single lock, without
+// their event logs. Jobs that cannot be read are omitted from the result.
+func (m *Manager) GetJobs(jobIDs []string) map[string]*Job {
+	m.mu.RLock()
+	defer m.mu.RUnlock()
+
+	jobs := make(map[string]*Job, len(jobIDs))
+	for _, jobID := range jobIDs {
+		job, err := m.getJob(jobID)
+		if err != nil {
+			m.logger.Warn("failed to read job", "job_id", jobID, "error", err)
+			continue
+		}
+		jobs[jobID] = job
+	}
+	return jobs
+}
+
+// getJob returns a copy of a job's metadata (caller must lock). Callers may
+// modify the copy and pass it to writeJobMetadata.
 func (m *Manager) getJob(jobID string) (*Job, error) {
+	job, ok := m.jobs[jobID]
+	if !ok {
+		return nil, fmt.Errorf("job not found: %s", jobID)
+	}
+
+	return cloneJob(job), nil
+}
+
+// allJobs returns copies of every job's metadata, ordered by job ID as the
+// jobs directory listing was (caller must lock)
+func (m *Manager) allJobs() []*Job {
+	jobIDs := make([]string, 0, len(m.jobs))
+	for jobID := range m.jobs {
+		jobIDs = append(jobIDs, jobID)
+	}
+	sort.Strings(jobIDs)
+
+	jobs := make([]*Job, 0, len(jobIDs))
+	for _, jobID := range jobIDs {
+		jobs = append(jobs, cloneJob(m.jobs[jobID]))
+	}
+	return jobs
+}
+
+// cloneJob deep-copies a cached job so callers can modify any part of it,
+// including command args and results, without touching the cache
+func cloneJob(job *Job) *Job {
+	copied := *job
+	copied.Command.Args, _ = cloneJSONValue(job.Command.Args).(map[string]interface{})
+	copied.DependsOn = cloneStrings(job.DependsOn)
+	copied.Tags = cloneStrings(job.Tags)
+	copied.Result = cloneJSONValue(job.Result)
+	if job.StartedAt != nil {
+		startedAt := *job.StartedAt
+		copied.StartedAt = &startedAt
+	}
+	if job.CompletedAt != nil {
+		completedAt := *job.CompletedAt
+		copied.CompletedAt = &completedAt
+	}
+	return &copied
+}
+
+// cloneStrings copies a string slice, preserving nil
+func cloneStrings(values []string) []string {
+	if values == nil {
+		return nil
+	}
+	return append([]string(nil), values...)
+}
+
+// cloneJSONValue deep-copies a value decoded by encoding/json into an
+// interface{} (maps, slices and scalars)
+func cloneJSONValue(value interface{}) interface{} {
+	switch v := value.(type) {
+	case map[string]interface{}:
+		if v == nil {
+			return v
+		}
+		copied := make(map[string]interface{}, len(v))
+		for key, item := range v {
+			copied[key] = cloneJSONValue(item)
+		}
+		return copied
+	case []interface{}:
+		if v == nil {
+			return v
+		}
+		copied := make([]interface{}, len(v))
+		for i, item := range v {
+			copied[i] = cloneJSONValue(item)
+		}
+		return copied
+	default:
+		return v
+	}
+}
+
+// readJobFile reads a job's metadata file from disk
+func (m *Manager) readJobFile(jobID string) (*Job, error) {
 	jobPath := m.jobFile(jobID)
 	data, err := os.ReadFile(jobPath)
 	if err != nil {
@@ -200,8 +345,34 @@ func (m *Manager) getJob(jobID string) (*Job, error) {
 	return &job, nil
 }
 
-// getEvents reads all events for a job (caller must handle locking if needed)
+// getEvents returns all events for a job (caller must hold the read lock).
+// Logs of queued and running jobs, which are polled while they grow, are read
+// from disk once and then extended by appendEvent. Finished jobs' logs are
+// read from disk on each call so job history doesn't accumulate in memory.
 func (m *Manager) getEvents(jobID string) ([]Event, error) {
+	if job, ok := m.jobs[jobID]; !ok || isFinished(job.Status) {
+		return m.readEvents(jobID)
+	}
+
+	m.eventsMu.Lock()
+	defer m.eventsMu.Unlock()
+
+	events, ok := m.events[jobID]
+	if !ok {
+		var err error
+		events, err = m.readEvents(jobID)
+		if err != nil {
+			return nil, err
+		}
+		m.events[jobID] = events
+	}
+
+	// Cap the slice so a caller appending to it can't write into the cache
+	return events[:len(events):len(events)], nil
+}
+
+// readEvents reads all events for a job from its events file
+func (m *Manager) readEvents(jobID string) ([]Event, error) {
 	eventsPath := m.eventsFile(jobID)
 	file, err := os.Open(eventsPath)
 	if err != nil {
@@ -234,27 +405,11 @@ func (m *Manager) ListAll() ([]JobResponse, error) {
 	m.mu.RLock()
 	defer m.mu.RUnlock()
 
-	entries, err := os.ReadDir(m.jobsDir)
-	if err != nil {
-		return nil, fmt.Errorf("failed to read jobs directory: %w", err)
-	}
-
 	var jobs []JobResponse
-	for _, entry := range entries {
-		if !entry.IsDir() {
-			continue
-		}
-
-		jobID := entry.Name()
-		job, err := m.getJob(jobID)
-		if err != nil {
-			m.logger.Error("failed to read job", "job_id", jobID, "error", err)
-			continue
-		}
-
-		events, err := m.getEvents(jobID)
+	for _, job := range m.allJobs() {
+		events, err := m.getEvents(job.ID)
 		if err != nil {
-			m.logger.Error("failed to read job events", "job_id", jobID, "error", err)
+			m.logger.Error("failed to read job events", "job_id", job.ID, "error", err)
 			events = []Event{}
 		}
 
@@ -286,28 +441,10 @@ func (m *Manager) ListAllTopoSorted() ([]JobResponse, error) {
 	m.mu.RLock()
 	defer m.mu.RUnlock()
 
-	entries, err := os.ReadDir(m.jobsDir)
-	if err != nil {
-		return nil, fmt.Errorf("failed to read jobs directory: %w", err)
-	}
-
-	var jobs []*Job
-	jobMap := make(map[string]*Job)
-
-	for _, entry := range entries {
-		if !entry.IsDir() {
-			continue
-		}
-
-		jobID := entry.Name()
-		job, err := m.getJob(jobID)
-		if err != nil {
-			m.logger.Error("failed to read job", "job_id", jobID, "error", err)
-			continue
-		}
-
-		jobs = append(jobs, job)
-		jobMap[jobID] = job
+	jobs := m.allJobs()
+	jobMap := make(map[string]*Job, len(jobs))
+	for _, job := range jobs {
+		jobMap[job.ID] = job
 	}
 
 	// Topological sort
@@ -380,54 +517,60 @@ func (m *Manager) Cancel(jobID string) error {
 	return nil
 }
 
+// CancelDependents cancels all queued jobs that depend on jobID, recursively
+func (m *Manager) CancelDependents(jobID string) {
+	m.mu.Lock()
+	defer m.mu.Unlock()
+
+	m.cascadeCancelDependents(jobID)
+}
+
 // cascadeCancelDependents recursively cancels all jobs that depend on jobID
+// (caller must hold the write lock)
 func (m *Manager) cascadeCancelDependents(jobID string) {
-	entries, err := os.ReadDir(m.jobsDir)
-	if err != nil {
-		m.logger.Error("failed to read jobs directory for cascade", "error", err)
-		return
+	// Index dependents once so each level of the cascade doesn't rescan and
+	// re-copy every job
+	dependents := make(map[string][]*Job)
+	for _, job := range m.allJobs() {
+		for _, dep := range job.DependsOn {
+			dependents[dep] = append(dependents[dep], job)
+		}
 	}
+	m.cancelDependents(jobID, dependents)
+}
 
-	for _, entry := range entries {
-		if !entry.IsDir() {
+// cancelDependents cancels the queued dependents of jobID using a prebuilt
+// dependents index, then cascades to their dependents
+func (m *Manager) cancelDependents(jobID string, dependents map[string][]*Job) {
+	for _, depJob := range dependents[jobID] {
+		if depJob.Status != StatusQueued {
 			continue
 		}
+		depJobID := depJob.ID
 
-		depJobID := entry.Name()
-		depJob, err := m.getJob(depJobID)
-		if err != nil {
+		// Cancel this job
+		depJob.Status = StatusCancelled
+		depJob.Error = fmt.Sprintf("dependency cancelled: %s", jobID)
+		now := time.Now().UTC()
+		depJob.CompletedAt = &now
+
+		if err := m.writeJobMetadata(depJob); err != nil {
+			m.logger.Error("failed to write job metadata during cascade", "job_id", depJobID, "error", err)
 			continue
 		}
 
-		// Check if this job depends on the cancelled job
-		for _, dep := range depJob.DependsOn {
-			if dep == jobID && depJob.Status == StatusQueued {
-				// Cancel this job
-				depJob.Status = StatusCancelled
-				depJob.Error = fmt.Sprintf("dependency cancelled: %s", jobID)
-				now := time.Now().UTC()
-				depJob.CompletedAt = &now
-
-				if err := m.writeJobMetadata(depJob); err != nil {
-					m.logger.Error("failed to write job metadata during cascade", "job_id", depJobID, "error", err)
-					continue
-				}
-
-				if err := m.appendEvent(depJobID, Event{
-					Timestamp: time.Now().UTC(),
-					Type:      "info",
-					Message:   fmt.Sprintf("Job cancelled due to dependency cancellation: %s", jobID),
-				}); err != nil {
-					m.logger.Error("failed to append event during cascade", "job_id", depJobID, "error", err)
-				}
+		if err := m.appendEvent(depJobID, Event{
+			Timestamp: time.Now().UTC(),
+			Type:      "info",
+			Message:   fmt.Sprintf("Job cancelled due to dependency cancellation: %s", jobID),
+		}); err != nil {
+			m.logger.Error("failed to append event during cascade", "job_id", depJobID, "error", err)
+		}
 
-				m.logger.Info("job cascade cancelled", "job_id", depJobID, "due_to", jobID)
+		m.logger.Info("job cascade cancelled", "job_id", depJobID, "due_to", jobID)
 
-				// Recursively cancel its dependents
-				m.cascadeCancelDependents(depJobID)
-				break
-			}
-		}
+		// Recursively cancel its dependents
+		m.cancelDependents(depJobID, dependents)
 	}
 }
 
@@ -447,55 +590,52 @@ func (m *Manager) Delete(jobID string) error {
 
 	// Delete job directory
 	jobDirPath := m.jobDir(jobID)
+	m.generation.Add(1)
 	if err := os.RemoveAll(jobDirPath); err != nil {
 		return fmt.Errorf("failed to delete job directory: %w", err)
 	}
+	delete(m.jobs, jobID)
+
+	m.eventsMu.Lock()
+	delete(m.events, jobID)
+	m.eventsMu.Unlock()
 
 	m.logger.Info("job deleted", "job_id", jobID)
 
 	return nil
 }
 
-// GetQueued returns all queued jobs in topological order
-func (m *Manager) GetQueued() ([]*Job, error) {
+// GetQueued returns all queued jobs in topological order, along with the
+// status of every job read in the same pass so callers can check
+// dependencies without reading each job again
+func (m *Manager) GetQueued() ([]*Job, map[string]JobStatus, error) {
 	m.mu.RLock()
 	defer m.mu.RUnlock()
 
-	entries, err := os.ReadDir(m.jobsDir)
-	if err != nil {
-		return nil, fmt.Errorf("failed to read jobs directory: %w", err)
-	}
-
 	var jobs []*Job
 	jobMap := make(map[string]*Job)
+	statuses := make(map[string]JobStatus, len(m.jobs))
 
-	for _, entry := range entries {
-		if !entry.IsDir() {
-			continue
-		}
-
-		jobID := entry.Name()
-		job, err := m.getJob(jobID)
-		if err != nil {
-			m.logger.Error("failed to read job", "job_id", jobID, "error", err)
-			continue
-		}
-
+	for _, job := range m.allJobs() {
+		statuses[job.ID] = job.Status
 		if job.Status == StatusQueued {
 			jobs = append(jobs, job)
-			jobMap[jobID] = job
+			jobMap[job.ID] = job
 		}
 	}
 
 	// Topological sort
 	sorted := m.topoSort(jobs, jobMap)
-	return sorted, nil
+	return sorted, statuses, nil
 }
 
 // topoSort performs a topological sort on queued jobs
 func (m *Manager) topoSort(jobs []*Job, jobMap map[string]*Job) []*Job {
-	// Build in-degree map - only count dependencies that are still queued
-	inDegree := make(map[string]int)
+	// Build in-degree map - only count dependencies that are still queued.
+	// Also record each job's dependents so the sort below doesn't rescan
+	// every job's dependency list for every job it emits.
+	inDegree := make(map[string]int, len(jobs))
+	dependents := make(map[string][]*Job, len(jobs))
 	for _, job := range jobs {
 		if _, exists := inDegree[job.ID]; !exists {
 			inDegree[job.ID] = 0
@@ -504,6 +644,7 @@ func (m *Manager) topoSort(jobs []*Job, jobMap map[string]*Job) []*Job {
 		for _, dep := range job.DependsOn {
 			if _, inQueued := jobMap[dep]; inQueued {
 				inDegree[job.ID]++
+				dependents[dep] = append(dependents[dep], job)
 			}
 		}
 	}
@@ -522,15 +663,11 @@ func (m *Manager) topoSort(jobs []*Job, jobMap map[string]*Job) []*Job {
 		queue = queue[1:]
 		sorted = append(sorted, job)
 
-		// Find jobs that depend on this one
-		for _, other := range jobs {
-			for _, dep := range other.DependsOn {
-				if dep == job.ID {
-					inDegree[other.ID]--
-					if inDegree[other.ID] == 0 {
-						queue = append(queue, other)
-					}
-				}
+		// Release jobs that depend on this one
+		for _, other := range dependents[job.ID] {
+			inDegree[other.ID]--
+			if inDegree[other.ID] == 0 {
+				queue = append(queue, other)
 			}
 		}
 	}
@@ -583,12 +720,14 @@ func (m *Manager) AppendEvent(jobID string, event Event) error {
 func (m *Manager) appendEvent(jobID string, event Event) error {
 	eventsPath := m.eventsFile(jobID)
 
-	// Ensure events file exists
-	if err := os.MkdirAll(filepath.Dir(eventsPath), 0755); err != nil {
-		return err
-	}
-
+	// Enqueue creates the job directory, so it is only recreated if missing
 	file, err := os.OpenFile(eventsPath, os.O_APPEND|os.O_CREATE|os.O_WRONLY, 0644)
+	if os.IsNotExist(err) {
+		if err := os.MkdirAll(filepath.Dir(eventsPath), 0755); err != nil {
+			return err
+		}
+		file, err = os.OpenFile(eventsPath, os.O_APPEND|os.O_CREATE|os.O_WRONLY, 0644)
+	}
 	if err != nil {
 		return fmt.Errorf("failed to open events file: %w", err)
 	}
@@ -600,27 +739,46 @@ func (m *Manager) appendEvent(jobID string, event Event) error {
 		return fmt.Errorf("failed to marshal event: %w", err)
 	}
 
-	_, err = file.Write(append(data, '\n'))
-	return err
+	if _, err := file.Write(append(data, '\n')); err != nil {
+		return err
+	}
+
+	// Only extend logs that have already been read; others are read in full
+	// from disk on first use
+	m.eventsMu.Lock()
+	if events, ok := m.events[jobID]; ok {
+		m.events[jobID] = append(events, event)
+	}
+	m.eventsMu.Unlock()
+
+	return nil
 }
 
 // writeJobMetadata writes job metadata to disk (caller must handle locking)
 func (m *Manager) writeJobMetadata(job *Job) error {
 	jobPath := m.jobFile(job.ID)
 
-	// Ensure job directory exists
-	if err := os.MkdirAll(filepath.Dir(jobPath), 0755); err != nil {
-		return err
-	}
+	// Bump before writing: a spurious queue pass is harmless, a missed one is not
+	m.generation.Add(1)
 
-	data, err := json.MarshalIndent(job, "", "  ")
+	// Compact encoding: job files are only read back by this manager, and
+	// results can carry large payloads that indentation would inflate
+	data, err := json.Marshal(job)
 	if err != nil {
 		return fmt.Errorf("failed to marshal job: %w", err)
 	}
 
 	// Write atomically: write to temp, then rename
+	// Enqueue creates the job directory, so it is only recreated if missing
 	tmpPath := jobPath + ".tmp"
-	if err := os.WriteFile(tmpPath, data, 0644); err != nil {
+	err = os.WriteFile(tmpPath, data, 0644)
+	if os.IsNotExist(err) {
+		if err := os.MkdirAll(filepath.Dir(jobPath), 0755); err != nil {
+			return err
+		}
+		err = os.WriteFile(tmpPath, data, 0644)
+	}
+	if err != nil {
 		return fmt.Errorf("failed to write job file: %w", err)
 	}
 
@@ -628,5 +786,26 @@ func (m *Manager) writeJobMetadata(job *Job) error {
 		return fmt.Errorf("failed to rename job file: %w", err)
 	}
 
+	// Cache the job as it will be read back from disk rather than the
+	// caller's value: command args and results then have the same JSON types
+	// (map[string]interface{}, float64, ...) the executor has always seen,
+	// and nothing is shared with the caller
+	var stored Job
+	if err := json.Unmarshal(data, &stored); err != nil {
+		return fmt.Errorf("failed to unmarshal job: %w", err)
+	}
+	m.jobs[job.ID] = &stored
+
+	// Finished jobs' event logs are no longer cached (see getEvents)
+	if isFinished(job.Status) {
+		m.eventsMu.Lock()
+		delete(m.events, job.ID)
+		m.eventsMu.Unlock()
+	}
 	return nil
 }
+
+// isFinished reports whether a job has reached a terminal status
+func isFinished(status JobStatus) bool {
+	return status == StatusCompleted || status == StatusFailed || status == StatusCancelled
+}
@@ -0,0 +1,64 @@
+package queue
+
+import (
+	"testing"
+	"time"
+)
+
+func TestEventCacheOnlyHoldsUnfinishedJobs(t *testing.T) {
+	m := newTestManager(t, t.TempDir())
+
+	jobID, err := m.Enqueue(Command{Type: CmdDeleteLink, Args: map[string]interface{}{"link_id": "chat"}}, nil)
+	if err != nil {
+		t.Fatalf("Enqueue: %v", err)
+	}
+
+	cachedLogs := func() int {
+		m.eventsMu.Lock()
+		defer m.eventsMu.Unlock()
+		return len(m.events)
+	}
+
+	eventCount := func() int {
+		job, err := m.Get(jobID)
+		if err != nil {
+			t.Fatalf("Get: %v", err)
+		}
+		return len(job.Events)
+	}
+
+	steps := []struct {
+		name       string
+		apply      func() error
+		wantEvents int
+		wantCached int
+	}{
+		{name: "queued", apply: func() error { return nil }, wantEvents: 1, wantCached: 1},
+		{name: "running", apply: func() error {
+			now := time.Now().UTC()
+			return m.UpdateStatus(jobID, StatusRunning, &now, nil, nil, "")
+		}, wantEvents: 1, wantCached: 1},
+		{name: "progress event", apply: func() error {
+			return m.AppendEvent(jobID, Event{Timestamp: time.Now().UTC(), Type: "progress", Message: "working"})
+		}, wantEvents: 2, wantCached: 1},
+		{name: "completed", apply: func() error {
+			now := time.Now().UTC()
+			return m.UpdateStatus(jobID, StatusCompleted, nil, &now, nil, "")
+		}, wantEvents: 2, wantCached: 0},
+		{name: "event after completion", apply: func() error {
+			return m.AppendEvent(jobID, Event{Timestamp: time.Now().UTC(), Type: "info", Message: "done"})
+		}, wantEvents: 3, wantCached: 0},
+	}
+
+	for _, step := range steps {
+		if err := step.apply(); err != nil {
+			t.Fatalf("%s: %v", step.name, err)
+		}
+		if got := eventCount(); got != step.wantEvents {
+			t.Errorf("%s: got %d events, want %d", step.name, got, step.wantEvents)
+		}
+		if got := cachedLogs(); got != step.wantCached {
+			t.Errorf("%s: %d cached event logs, want %d", step.name, got, step.wantCached)
+		}
+	}
+}
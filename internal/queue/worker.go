@@ -19,8 +19,18 @@ type Worker struct {
 	logger   *slog.Logger
 	stop     chan struct{}
 	done     chan struct{}
+
+	// Manager generation and time of the last queue pass that found nothing to run
+	idleGeneration uint64
+	idleAt         time.Time
 }
 
+// idleRescanInterval forces a pass over the in-memory queue even when the
+// manager reports no changes, as a safety net against a missed generation
+// bump. Job files edited on disk are not picked up; the manager only reads
+// them at startup.
+const idleRescanInterval = 30 * time.Second
+
 // NewWorker creates a new job worker
 func NewWorker(manager *Manager, executor Executor, logger *slog.Logger) *Worker {
 	return &Worker{
@@ -66,13 +76,21 @@ func (w *Worker) run(ctx context.Context) {
 
 // processNextJob picks the next runnable job and executes it
 func (w *Worker) processNextJob(ctx context.Context) {
-	queued, err := w.manager.GetQueued()
+	// Skip the queue pass (GetQueued copies and sorts every job in memory) if
+	// no job has changed since the last idle tick
+	generation := w.manager.Generation()
+	if !w.idleAt.IsZero() && generation == w.idleGeneration && time.Since(w.idleAt) < idleRescanInterval {
+		return
+	}
+
+	queued, statuses, err := w.manager.GetQueued()
 	if err != nil {
 		w.logger.Error("failed to get queued jobs", "error", err)
 		return
 	}
 
 	if len(queued) == 0 {
+		w.markIdle(generation)
 		return
 	}
 
@@ -80,7 +98,8 @@ func (w *Worker) processNextJob(ctx context.Context) {
 	job := queued[0]
 
 	// Verify dependencies are satisfied
-	if !w.dependenciesSatisfied(job) {
+	if !w.dependenciesSatisfied(job, statuses) {
+		w.markIdle(generation)
 		return
 	}
 
@@ -88,24 +107,31 @@ func (w *Worker) processNextJob(ctx context.Context) {
 	w.executeJob(ctx, job)
 }
 
-// dependenciesSatisfied checks if all dependencies of a job are completed
-func (w *Worker) dependenciesSatisfied(job *Job) bool {
+// markIdle records that the queue pass at generation found nothing runnable
+func (w *Worker) markIdle(generation uint64) {
+	w.idleGeneration = generation
+	w.idleAt = time.Now()
+}
+
+// dependenciesSatisfied checks if all dependencies of a job are completed,
+// using the job statuses read by GetQueued during this tick
+func (w *Worker) dependenciesSatisfied(job *Job, statuses map[string]JobStatus) bool {
 	for _, depID := range job.DependsOn {
-		depJob, err := w.manager.Get(depID)
-		if err != nil {
-			w.logger.Error("failed to fetch dependency", "job_id", depID, "error", err)
+		depStatus, ok := statuses[depID]
+		if !ok {
+			w.logger.Error("failed to fetch dependency", "job_id", depID, "error", "job not found")
 			return false
 		}
 
 		// Dependency must be completed or failed (not queued or running)
-		if depJob.Status != StatusCompleted && depJob.Status != StatusFailed && depJob.Status != StatusCancelled {
+		if depStatus != StatusCompleted && depStatus != StatusFailed && depStatus != StatusCancelled {
 			return false
 		}
 
 		// If dependency failed or was cancelled, this job will be auto-cancelled
-		if depJob.Status == StatusFailed || depJob.Status == StatusCancelled {
+		if depStatus == StatusFailed || depStatus == StatusCancelled {
 			// Auto-cancel this job as well
-			w.autoCancelDueToFailedDep(job.ID, depID, depJob.Status)
+			w.autoCancelDueToFailedDep(job.ID, depID, depStatus)
 			return false
 		}
 	}
@@ -131,17 +157,19 @@ func (w *Worker) autoCancelDueToFailedDep(jobID, depID string, depStatus JobStat
 	}
 
 	// Cascade cancellation to dependents
-	w.manager.cascadeCancelDependents(jobID)
+	w.manager.CancelDependents(jobID)
 }
 
 // executeJob runs a single job
 func (w *Worker) executeJob(ctx context.Context, job *Job) {
-	w.logger.Info("executing job", "job_id", job.ID, "command", job.Command.Type)
+	// Bind job attributes once; the handler pre-encodes them for every line below
+	logger := w.logger.With("job_id", job.ID)
+	logger.Info("executing job", "command", job.Command.Type)
 
 	// Mark job as running
 	now := time.Now().UTC()
 	if err := w.manager.UpdateStatus(job.ID, StatusRunning, &now, nil, nil, ""); err != nil {
-		w.logger.Error("failed to mark job as running", "job_id", job.ID, "error", err)
+		logger.Error("failed to mark job as running", "error", err)
 		return
 	}
 
@@ -150,7 +178,7 @@ func (w *Worker) executeJob(ctx context.Context, job *Job) {
 		Type:      "info",
 		Message:   "Job execution started",
 	}); err != nil {
-		w.logger.Error("failed to append event", "job_id", job.ID, "error", err)
+		logger.Error("failed to append event", "error", err)
 	}
 
 	// Execute the command
@@ -164,33 +192,33 @@ func (w *Worker) executeJob(ctx context.Context, job *Job) {
 	if execErr != nil {
 		status = StatusFailed
 		errMsg = execErr.Error()
-		w.logger.Error("job execution failed", "job_id", job.ID, "error", execErr)
+		logger.Error("job execution failed", "error", execErr)
 
 		if err := w.manager.AppendEvent(job.ID, Event{
 			Timestamp: time.Now().UTC(),
 			Type:      "error",
 			Message:   fmt.Sprintf("Job failed: %v", execErr),
 		}); err != nil {
-			w.logger.Error("failed to append event", "job_id", job.ID, "error", err)
+			logger.Error("failed to append event", "error", err)
 		}
 
 		// Cascade cancellation to dependents
-		w.manager.cascadeCancelDependents(job.ID)
+		w.manager.CancelDependents(job.ID)
 	} else {
 		status = StatusCompleted
-		w.logger.Info("job execution completed", "job_id", job.ID)
+		logger.Info("job execution completed")
 
 		if err := w.manager.AppendEvent(job.ID, Event{
 			Timestamp: time.Now().UTC(),
 			Type:      "info",
 			Message:   "Job execution completed",
 		}); err != nil {
-			w.logger.Error("failed to append event", "job_id", job.ID, "error", err)
+			logger.Error("failed to append event", "error", err)
 		}
 	}
 
 	// Update final status
 	if err := w.manager.UpdateStatus(job.ID, status, &now, &completedTime, result, errMsg); err != nil {
-		w.logger.Error("failed to update job status", "job_id", job.ID, "error", err)
+		logger.Error("failed to update job status", "error", err)
 	}
 }
@@ -3,11 +3,38 @@ package system
 import (
 	"os"
 	"os/exec"
+	"sync"
+	"time"
 )
 
+// gpuCacheTTL bounds how long a detection result is reused. GPU tooling only
+// changes when drivers are installed, so a short TTL avoids re-scanning PATH
+// on every module install/link while still picking up changes quickly.
+const gpuCacheTTL = 30 * time.Second
+
+var gpuCache struct {
+	mu         sync.Mutex
+	vendor     string
+	detectedAt time.Time
+}
+
 // DetectGPU detects the GPU vendor on the host system
 // Returns "nvidia", "amd", "intel", or "" if no GPU detected
 func DetectGPU() string {
+	gpuCache.mu.Lock()
+	defer gpuCache.mu.Unlock()
+
+	if !gpuCache.detectedAt.IsZero() && time.Since(gpuCache.detectedAt) < gpuCacheTTL {
+		return gpuCache.vendor
+	}
+
+	gpuCache.vendor = detectGPU()
+	gpuCache.detectedAt = time.Now()
+	return gpuCache.vendor
+}
+
+// detectGPU probes the host for GPU tooling (uncached)
+func detectGPU() string {
 	// Check for NVIDIA GPU
 	if hasNvidiaGPU() {
 		return "nvidia"
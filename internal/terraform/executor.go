@@ -5,6 +5,7 @@ import (
 	"encoding/json"
 	"fmt"
 	"os/exec"
+	"sync"
 
 	"github.com/hashicorp/terraform-exec/tfexec"
 )
@@ -22,10 +23,33 @@ type OutputMeta struct {
 	Value     interface{}
 }
 
+var (
+	terraformPathMu sync.Mutex
+	terraformPath   string
+)
+
+// lookupTerraform resolves the terraform binary once and reuses the result.
+// Failures are not cached so a later install of terraform is picked up.
+func lookupTerraform() (string, error) {
+	terraformPathMu.Lock()
+	defer terraformPathMu.Unlock()
+
+	if terraformPath != "" {
+		return terraformPath, nil
+	}
+
+	path, err := exec.LookPath("terraform")
+	if err != nil {
+		return "", err
+	}
+	terraformPath = path
+	return terraformPath, nil
+}
+
 // NewExecutor creates a new Terraform executor for the given module path
 func NewExecutor(modulePath string) (*Executor, error) {
 	// Find terraform binary
-	terraformPath, err := exec.LookPath("terraform")
+	terraformPath, err := lookupTerraform()
 	if err != nil {
 		return nil, fmt.Errorf("terraform binary not found: %w", err)
 	}
@@ -0,0 +1,113 @@
+package terraform
+
+import (
+	"encoding/json"
+	"errors"
+	"fmt"
+	"os"
+	"path/filepath"
+	"sync"
+	"time"
+)
+
+// stateFileName is the local backend state file terraform writes in the module directory
+const stateFileName = "terraform.tfstate"
+
+// stateFile is the subset of the terraform state format needed to read outputs
+type stateFile struct {
+	Outputs map[string]struct {
+		Value     json.RawMessage `json:"value"`
+		Type      json.RawMessage `json:"type"`
+		Sensitive bool            `json:"sensitive"`
+	} `json:"outputs"`
+}
+
+// stateCacheEntry holds parsed outputs along with the state file's size and
+// mtime at the time it was read
+type stateCacheEntry struct {
+	size    int64
+	modTime time.Time
+	outputs map[string]*OutputMeta
+}
+
+// stateCache memoizes parsed outputs per state file. Module listing reads every
+// module's state on each request, while the files only change on apply/destroy.
+var stateCache sync.Map // statePath -> stateCacheEntry
+
+// ReadOutputs returns the module's outputs by reading its local state file
+// directly, which avoids spawning `terraform output` for every read. Values
+// are json.RawMessage, matching what Executor.Output returns. If there is no
+// readable local state (not applied yet, remote backend, mid-write), it falls
+// back to running terraform.
+func ReadOutputs(modulePath string) (map[string]*OutputMeta, error) {
+	outputs, err := readStateOutputs(filepath.Join(modulePath, stateFileName))
+	if err == nil {
+		return outputs, nil
+	}
+
+	executor, execErr := NewExecutor(modulePath)
+	if execErr != nil {
+		return nil, execErr
+	}
+	return executor.Output()
+}
+
+// readStateOutputs returns outputs from a terraform state file, reusing the
+// previous parse while the file's size and mtime are unchanged
+func readStateOutputs(statePath string) (map[string]*OutputMeta, error) {
+	info, err := os.Stat(statePath)
+	if err != nil {
+		stateCache.Delete(statePath)
+		return nil, err
+	}
+	if cached, ok := stateCache.Load(statePath); ok {
+		entry := cached.(stateCacheEntry)
+		if entry.size == info.Size() && entry.modTime.Equal(info.ModTime()) {
+			return copyOutputs(entry.outputs), nil
+		}
+	}
+
+	outputs, err := parseStateOutputs(statePath)
+	if err != nil {
+		stateCache.Delete(statePath)
+		return nil, err
+	}
+	stateCache.Store(statePath, stateCacheEntry{size: info.Size(), modTime: info.ModTime(), outputs: outputs})
+	return copyOutputs(outputs), nil
+}
+
+// copyOutputs returns a shallow copy so callers can't modify the cached map
+func copyOutputs(outputs map[string]*OutputMeta) map[string]*OutputMeta {
+	result := make(map[string]*OutputMeta, len(outputs))
+	for name, output := range outputs {
+		result[name] = output
+	}
+	return result
+}
+
+// parseStateOutputs reads and parses outputs from a terraform state file
+func parseStateOutputs(statePath string) (map[string]*OutputMeta, error) {
+	data, err := os.ReadFile(statePath)
+	if err != nil {
+		return nil, err
+	}
+	if len(data) == 0 {
+		return nil, errors.New("state file is empty")
+	}
+
+	var state stateFile
+	if err := json.Unmarshal(data, &state); err != nil {
+		return nil, fmt.Errorf("failed to parse state file: %w", err)
+	}
+
+	result := make(map[string]*OutputMeta, len(state.Outputs))
+	for name, output := range state.Outputs {
+		result[name] = &OutputMeta{
+			Sensitive: output.Sensitive,
+			Type:      output.Type,
+			Value:     output.Value,
+		}
+	}
+
+	return result, nil
+}
@@ -0,0 +1,153 @@
+package terraform
+
+import (
+	"encoding/json"
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+)
+
+const sampleState = `{
+  "version": 4,
+  "terraform_version": "1.9.0",
+  "outputs": {
+    "main_ports": {
+      "value": {"http": {"port": 8080, "protocol": "http"}},
+      "type": ["object", {"http": ["object", {"port": "number", "protocol": "string"}]}]
+    },
+    "api_key": {
+      "value": "secret",
+      "type": "string",
+      "sensitive": true
+    }
+  },
+  "resources": []
+}`
+
+func writeState(t *testing.T, path, content string, modTime time.Time) {
+	t.Helper()
+	if err := os.WriteFile(path, []byte(content), 0644); err != nil {
+		t.Fatal(err)
+	}
+	if err := os.Chtimes(path, modTime, modTime); err != nil {
+		t.Fatal(err)
+	}
+}
+
+func outputValue(t *testing.T, outputs map[string]*OutputMeta, name string) string {
+	t.Helper()
+	output, ok := outputs[name]
+	if !ok {
+		t.Fatalf("output %q missing", name)
+	}
+	raw, ok := output.Value.(json.RawMessage)
+	if !ok {
+		t.Fatalf("output %q value has type %T, want json.RawMessage", name, output.Value)
+	}
+	return string(raw)
+}
+
+func TestReadStateOutputs(t *testing.T) {
+	statePath := filepath.Join(t.TempDir(), stateFileName)
+	modTime := time.Now().Add(-time.Hour).Truncate(time.Second)
+	writeState(t, statePath, sampleState, modTime)
+
+	outputs, err := readStateOutputs(statePath)
+	if err != nil {
+		t.Fatalf("readStateOutputs: %v", err)
+	}
+	if len(outputs) != 2 {
+		t.Fatalf("got %d outputs, want 2", len(outputs))
+	}
+	if got := outputValue(t, outputs, "api_key"); got != `"secret"` {
+		t.Errorf("api_key value = %s", got)
+	}
+	if !outputs["api_key"].Sensitive || outputs["main_ports"].Sensitive {
+		t.Errorf("sensitive flags not preserved")
+	}
+
+	var ports map[string]map[string]interface{}
+	if err := json.Unmarshal([]byte(outputValue(t, outputs, "main_ports")), &ports); err != nil {
+		t.Fatalf("main_ports value is not valid JSON: %v", err)
+	}
+	if ports["http"]["port"] != float64(8080) {
+		t.Errorf("main_ports.http.port = %v, want 8080", ports["http"]["port"])
+	}
+
+	// Callers get their own map, so changing it must not affect the cache
+	delete(outputs, "api_key")
+	outputs, err = readStateOutputs(statePath)
+	if err != nil {
+		t.Fatalf("cached readStateOutputs: %v", err)
+	}
+	if _, ok := outputs["api_key"]; !ok {
+		t.Errorf("modifying a returned map changed the cached outputs")
+	}
+}
+
+func TestReadStateOutputsInvalidation(t *testing.T) {
+	oneOutput := `{"outputs": {"a": {"value": "1", "type": "string"}}}`
+	twoOutputs := `{"outputs": {"a": {"value": "2", "type": "string"}, "b": {"value": "3", "type": "string"}}}`
+	// Same size as oneOutput, so only the mtime distinguishes it
+	sameSize := `{"outputs": {"a": {"value": "9", "type": "string"}}}`
+
+	base := time.Now().Add(-time.Hour).Truncate(time.Second)
+
+	tests := []struct {
+		name      string
+		content   string
+		modTime   time.Time
+		wantValue string
+	}{
+		{name: "initial read", content: oneOutput, modTime: base, wantValue: `"1"`},
+		{name: "size change", content: twoOutputs, modTime: base, wantValue: `"2"`},
+		{name: "mtime change with same size", content: sameSize, modTime: base.Add(time.Minute), wantValue: `"9"`},
+		{name: "rewrite with same size and mtime is served from cache", content: `{"outputs": {"a": {"value": "7", "type": "string"}}}`, modTime: base.Add(time.Minute), wantValue: `"9"`},
+	}
+
+	statePath := filepath.Join(t.TempDir(), stateFileName)
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			writeState(t, statePath, tt.content, tt.modTime)
+			outputs, err := readStateOutputs(statePath)
+			if err != nil {
+				t.Fatalf("readStateOutputs: %v", err)
+			}
+			if got := outputValue(t, outputs, "a"); got != tt.wantValue {
+				t.Errorf("a = %s, want %s", got, tt.wantValue)
+			}
+		})
+	}
+
+	// A removed state file is an error and drops the cache entry
+	if err := os.Remove(statePath); err != nil {
+		t.Fatal(err)
+	}
+	if _, err := readStateOutputs(statePath); err == nil {
+		t.Fatalf("readStateOutputs on missing file: expected error")
+	}
+	if _, ok := stateCache.Load(statePath); ok {
+		t.Errorf("cache entry kept for missing state file")
+	}
+}
+
+func TestReadStateOutputsErrors(t *testing.T) {
+	tests := []struct {
+		name    string
+		content string
+	}{
+		{name: "empty file", content: ""},
+		{name: "invalid JSON", content: `{"outputs": `},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			statePath := filepath.Join(t.TempDir(), stateFileName)
+			writeState(t, statePath, tt.content, time.Now())
+			if _, err := readStateOutputs(statePath); err == nil {
+				t.Errorf("expected error")
+			}
+		})
+	}
+}
@@ -3,6 +3,7 @@ package xds
 import (
 	"fmt"
 	"strings"
+	"sync"
 
 	cluster "github.com/envoyproxy/go-control-plane/envoy/config/cluster/v3"
 	core "github.com/envoyproxy/go-control-plane/envoy/config/core/v3"
@@ -22,32 +23,10 @@ import (
 	"google.golang.org/protobuf/types/known/wrapperspb"
 )
 
-// BuildSnapshot creates a snapshot with listeners, routes, and clusters
-func BuildSnapshot(version string) (*cache.Snapshot, error) {
-	// Create HTTP listener on port 80
-	httpListener, err := makeHTTPListener()
-	if err != nil {
-		return nil, fmt.Errorf("failed to create HTTP listener: %w", err)
-	}
-
-	// Create empty route configuration (returns 404 for everything)
-	routeConfig := makeEmptyRouteConfig()
-
-	// Build snapshot with all resources
-	snapshot, err := cache.NewSnapshot(
-		version,
-		map[resource.Type][]types.Resource{
-			resource.ClusterType:  {}, // Empty clusters for now
-			resource.RouteType:    {routeConfig},
-			resource.ListenerType: {httpListener},
-		},
-	)
-	if err != nil {
-		return nil, fmt.Errorf("failed to create snapshot: %w", err)
-	}
-
-	return snapshot, nil
-}
+// sharedHTTPListener returns the port 80 listener. It is identical in every
+// snapshot, so it is built and marshalled once and shared; snapshots treat
+// their resources as read-only.
+var sharedHTTPListener = sync.OnceValues(makeHTTPListener)
 
 // makeHTTPListener creates a listener on port 80 with HTTP connection manager
 func makeHTTPListener() (*listener.Listener, error) {
@@ -230,7 +209,7 @@ func BuildSnapshotFromExposures(version string, exposures []*Exposure) (*cache.S
 
 	// Build HTTP listener and routes if we have HTTP exposures
 	if len(httpExposures) > 0 {
-		httpListener, err := makeHTTPListener()
+		httpListener, err := sharedHTTPListener()
 		if err != nil {
 			return nil, fmt.Errorf("failed to create HTTP listener: %w", err)
 		}
@@ -248,7 +227,7 @@ func BuildSnapshotFromExposures(version string, exposures []*Exposure) (*cache.S
 		}
 	} else {
 		// No HTTP exposures, use empty route config
-		httpListener, err := makeHTTPListener()
+		httpListener, err := sharedHTTPListener()
 		if err != nil {
 			return nil, fmt.Errorf("failed to create HTTP listener: %w", err)
 		}